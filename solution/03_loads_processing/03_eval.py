@@ -1,4 +1,6 @@
 from pathlib import Path
+import asyncio
+import os
 import sys
 
 # Add tools to path so we can import dependencies
@@ -21,6 +23,10 @@ from activities import ActivityRegistry  # This triggers auto-registration of al
 # All activity definitions are now in the activities/ package
 # Activities are auto-registered when the activities package is imported
 
+# Upper bound on in-flight agent runs so concurrent evaluation cases
+# don't trip provider rate limits (429s). Tune via MAX_CONCURRENT_LLM.
+MAX_CONCURRENT_LLM = int(os.getenv("MAX_CONCURRENT_LLM", "5"))
+
 
 def load_system_prompt() -> str:
     """Load system prompt by reading the use case definition files."""
@@ -98,7 +104,32 @@ Key Operations required:
 DO NOT ASK QUESTIONS. USE THE PROVIDED TOOLS TO PROCESS LOADS AND GENERATE OUTPUTS.
 """
 
-async def agent_task(inputs: str, model_override: str | None = None, server: "MCPServerStdio | None" = None):
+def get_agent(model_override: str | None = None, server: "MCPServerStdio | None" = None):
+    """
+    Build the evaluation agent for the given model and server.
+
+    Args:
+        model_override: Either a full model name or a simple model key
+        server: Optional MCPServerStdio instance to use
+    """
+    # Using SIMPLE_SYSTEM_PROMPT for consistent behavior
+    system_prompt = SIMPLE_SYSTEM_PROMPT
+
+    # Check if model_override is a simple key or full model name
+    if model_override and is_valid_model_key(model_override):
+        # Use the new factory function for simple model keys
+        return create_loadset_agent_with_model(model_key=model_override, system_prompt=system_prompt, server=server)
+    # Use the original function for full model names or default
+    return create_loadset_agent(system_prompt=system_prompt, model_override=model_override, server=server)
+
+
+async def agent_task(
+    inputs: str,
+    model_override: str | None = None,
+    server: "MCPServerStdio | None" = None,
+    llm_sem: asyncio.Semaphore | None = None,
+    agent=None,
+):
     """
     Task function that runs the agent with the given inputs.
     
@@ -107,6 +138,8 @@ async def agent_task(inputs: str, model_override: str | None = None, server: "MC
         model_override: Either a full model name (e.g., "anthropic:claude-3-haiku-20240307") 
                        or a simple model key (e.g., "haiku", "kimi", "qwen-thinking")
         server: Optional MCPServerStdio instance to use
+        llm_sem: Optional semaphore bounding concurrent agent runs
+        agent: Optional prebuilt agent; built from model_override/server if omitted
     """
     # Import the updated system prompt function from process_loads
     import sys
@@ -117,20 +150,17 @@ async def agent_task(inputs: str, model_override: str | None = None, server: "MC
     if str(process_loads_dir) not in sys.path:
         sys.path.insert(0, str(process_loads_dir))
     
-    # Using SIMPLE_SYSTEM_PROMPT for consistent behavior
-    system_prompt = SIMPLE_SYSTEM_PROMPT
-    
-    # Check if model_override is a simple key or full model name
-    if model_override and is_valid_model_key(model_override):
-        # Use the new factory function for simple model keys
-        agent = create_loadset_agent_with_model(model_key=model_override, system_prompt=system_prompt, server=server)
-    else:
-        # Use the original function for full model names or default
-        agent = create_loadset_agent(system_prompt=system_prompt, model_override=model_override, server=server)
+    # Callers evaluating many cases pass the agent in instead of rebuilding per case
+    if agent is None:
+        agent = get_agent(model_override, server)
     
-    # Run the agent asynchronously
+    # Run the agent asynchronously, bounded by the caller's LLM semaphore (if any)
     # Note: deps are no longer needed as tools are handled by MCPServerStdio
-    result = await agent.run(inputs)
+    if llm_sem is None:
+        result = await agent.run(inputs)
+    else:
+        async with llm_sem:
+            result = await agent.run(inputs)
     return result.output
 
 
@@ -143,73 +173,81 @@ async def main(activities: list[str] | None = None, model_name: str | None = Non
         global_iterations: Global iterations override for all activities (None to use activity defaults)
     """
     import logfire
-    import asyncio
     
     # Auto-discover available activities if none specified
     if activities is None:
         activities = ActivityRegistry.list_activities()
         print(f"Auto-discovered activities: {activities}")
     
+    # Created per run: an asyncio.Semaphore binds to the loop that first uses it,
+    # and main() may be called through several asyncio.run() calls
+    llm_sem = asyncio.Semaphore(MAX_CONCURRENT_LLM)
+
     # Create shared MCP server instance
     from tools.agents import create_default_server
     server = create_default_server()
     
+    # Build the agent once per run; it holds the server, so it is not cached globally
+    agent = get_agent(model_name, server)
+
     # Use context manager to manage server lifecycle
     async with server:
         with logfire.span("load_processing_evaluation"):
             logfire.info("Starting evaluation for load processing agent", activities=activities)
             print(f"Running evaluation for activities: {', '.join(activities)}")
             
-            reports = {}
-            wait_time = 0  # Waiting time to avoid hitting token limits at anthropic
-            
-            for i, activity in enumerate(activities):
+            async def run_activity(activity: str):
+                """Evaluate one activity; returns None if it raises a ValueError."""
                 try:
-                    # Get dataset and evaluators from registry
+                    # Get dataset and evaluators from registry (fresh instances per activity)
                     dataset = ActivityRegistry.create_dataset(activity, iterations_override=global_iterations)
                     evaluators = ActivityRegistry.get_evaluators(activity)
-                    
-                    # Add wait time between activities (but not before the first one)
-                    if i > 0:
-                        print(f"Waiting {wait_time} seconds before starting Activity {activity}...")
-                        await asyncio.sleep(wait_time)
-                    
-                    # Evaluate the activity
+
                     print(f"\n=== Activity {activity} Evaluation ===")
                     logfire.info(
                         f"Activity {activity} evaluation setup",
                         dataset_cases=len(dataset.cases),
                         evaluators=[type(e).__name__ for e in evaluators]
                     )
-                    
-                    # Create a wrapper function with model override if specified
-                    # We also need to pass the server to agent_task
-                    if model_name:
-                        # Create a wrapper that captures the model_name and server
-                        current_model = model_name  # Capture in closure
-                        async def task_func(inputs: str):
-                            return await agent_task(inputs, model_override=current_model, server=server)
-                    else:
-                        # Create a wrapper that captures just the server
-                        async def task_func(inputs: str):
-                            return await agent_task(inputs, server=server)
-                    
+
+                    # Wrapper that captures the shared agent and semaphore
+                    async def task_func(inputs: str):
+                        return await agent_task(inputs, llm_sem=llm_sem, agent=agent)
+
                     report = await dataset.evaluate(task_func)
-                    
+
                     logfire.info(
                         f"Activity {activity} evaluation completed",
                         total_cases=len(report.cases)
                     )
-                    
-                    print(f"\n=== Activity {activity} Report ===")
-                    report.print()
-                    
-                    reports[activity] = report
-                    
+                    return report
+
                 except ValueError as e:
                     print(f"Error: {e}")
+                    return None
+
+            # Evaluate all activities concurrently; agent runs stay bounded by llm_sem.
+            # gather preserves the activity order for the reports, and return_exceptions
+            # keeps one failing activity from discarding the others' finished reports.
+            results = await asyncio.gather(
+                *(run_activity(activity) for activity in activities),
+                return_exceptions=True,
+            )
+
+            reports = {}
+            for activity, report in zip(activities, results):
+                if isinstance(report, BaseException) and not isinstance(report, Exception):
+                    raise report  # cancellation / interrupts are not activity failures
+                if isinstance(report, Exception):
+                    print(f"Error: Activity {activity} failed: {report!r}")
+                    logfire.error(f"Activity {activity} evaluation failed", error=repr(report))
                     continue
-            
+                if report is None:
+                    continue
+                print(f"\n=== Activity {activity} Report ===")
+                report.print()
+                reports[activity] = report
+
             return reports
 
 
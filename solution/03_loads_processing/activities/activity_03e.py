@@ -1,6 +1,5 @@
 from pathlib import Path
 from pydantic_ai import Agent, BinaryContent
-from pydantic_ai.messages import ImageMediaType
 from pydantic import BaseModel, Field
 import logfire
 
@@ -6,7 +6,7 @@ The system prompt is dynamically loaded from use case definition files to ensure
 Uses the Loads MCP server for all load processing operations.
 """
 
-from math import log
+from functools import lru_cache
 from pathlib import Path
 import sys
 from dotenv import load_dotenv
@@ -27,6 +27,7 @@ from tools.agents import create_loadset_agent
 from tools.mcps.loads_mcp_server import LoadSetMCPProvider
 
 
+@lru_cache(maxsize=1)
 def load_system_prompt() -> str:
     """
     Load system prompt by reading the use case definition files.
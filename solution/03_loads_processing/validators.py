@@ -5,12 +5,34 @@ from pydantic_evals.evaluators import Evaluator, EvaluatorContext
 from pydantic_evals.otel import SpanQuery
 
 
+def _running_tool_query(tool_name: str) -> SpanQuery:
+    """Query matching the 'running tool' span of a given tool."""
+    return SpanQuery(
+        name_equals='running tool',
+        has_attributes={'gen_ai.tool.name': tool_name},
+    )
+
+
+def _agent_called_tool_query(tool_name: str) -> SpanQuery:
+    """Query matching an 'agent run' span in which the given tool was run."""
+    return SpanQuery(
+        name_equals='agent run',
+        stop_recursing_when=SpanQuery(name_equals='agent run'),
+        some_descendant_has=_running_tool_query(tool_name),
+    )
+
+
 @dataclass
 class ToolCalled(Evaluator):
     """Simplified evaluator to check if a specific tool was called (without agent name)."""
     tool_name: str
     tool_arguments: dict[str, Any] | None = None
 
+    def __post_init__(self):
+        # Build the span queries once, not per evaluation
+        self._agent_query = _agent_called_tool_query(self.tool_name)
+        self._tool_query = _running_tool_query(self.tool_name)
+
     def _extract_tool_arguments(self, span) -> dict[str, Any] | None:
         """Extract and parse tool_arguments from span attributes."""
         if not (hasattr(span, 'attributes') and 'tool_arguments' in span.attributes):
@@ -34,18 +56,9 @@ class ToolCalled(Evaluator):
         import logfire
         
         with logfire.span(f"evaluate_tool_called_{self.tool_name}"):
-            # If no tool_arguments specified, use the original simple logic
-            if self.tool_arguments is None:
-                result = ctx.span_tree.any(
-                    SpanQuery(
-                        name_equals='agent run',
-                        stop_recursing_when=SpanQuery(name_equals='agent run'),
-                        some_descendant_has=SpanQuery(
-                            name_equals='running tool',
-                            has_attributes={'gen_ai.tool.name': self.tool_name},
-                        ),
-                    )
-                )
+            # If no tool_arguments specified (None or empty), use the original simple logic
+            if not self.tool_arguments:
+                result = ctx.span_tree.any(self._agent_query)
                 
                 logfire.info(
                     f"ToolCalled evaluation for '{self.tool_name}' (no argument checking)",
@@ -56,12 +69,7 @@ class ToolCalled(Evaluator):
                 return result
             
             # If tool_arguments are specified, we need to find spans and check arguments manually
-            tool_spans = ctx.span_tree.find(
-                SpanQuery(
-                    name_equals='running tool',
-                    has_attributes={'gen_ai.tool.name': self.tool_name},
-                )
-            )
+            tool_spans = ctx.span_tree.find(self._tool_query)
             
             if not tool_spans:
                 logfire.info(
@@ -77,11 +85,9 @@ class ToolCalled(Evaluator):
                 actual_arguments = self._extract_tool_arguments(span)
                 
                 if actual_arguments:
-                    # Check if all expected arguments match
-                    arguments_match = all(
-                        actual_arguments.get(key) == expected_value
-                        for key, expected_value in self.tool_arguments.items()
-                    )
+                    # Check if all expected arguments match: an items-view subset test
+                    # looks each key up and compares values in C (values need not be hashable)
+                    arguments_match = self.tool_arguments.items() <= actual_arguments.items()
                     
                     if arguments_match:
                         logfire.info(
@@ -109,21 +115,16 @@ class ToolNotCalled(Evaluator):
     """Evaluator to check that a specific tool was NOT called by the agent."""
     tool_name: str
 
+    def __post_init__(self):
+        # Build the span query once, not per evaluation
+        self._agent_query = _agent_called_tool_query(self.tool_name)
+
     def evaluate(self, ctx: EvaluatorContext) -> bool:
         import logfire
         
         with logfire.span(f"evaluate_tool_NOT_called_{self.tool_name}"):
             # Check if the tool was called (opposite of what we want)
-            tool_was_called = ctx.span_tree.any(
-                SpanQuery(
-                    name_equals='agent run',
-                    stop_recursing_when=SpanQuery(name_equals='agent run'),
-                    some_descendant_has=SpanQuery(
-                        name_equals='running tool',
-                        has_attributes={'gen_ai.tool.name': self.tool_name},
-                    ),
-                )
-            )
+            tool_was_called = ctx.span_tree.any(self._agent_query)
             
             # Return the opposite - True if tool was NOT called
             result = not tool_was_called
@@ -14,17 +14,31 @@ import asyncio
 import pytest
 import subprocess
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-# No typing imports needed
 from dotenv import load_dotenv
-from pydantic_ai import Agent
-from pydantic_ai.mcp import MCPServerStdio, MCPServerStreamableHTTP
 
 from tools.loads import LoadSet
 
+if TYPE_CHECKING:
+    # Imported lazily in the agent clients so collecting this (expensive-marked)
+    # module does not pull in pydantic-ai
+    from pydantic_ai import Agent
+    from pydantic_ai.mcp import MCPServerStdio, MCPServerStreamableHTTP
+
 # Load environment variables from .env file
 load_dotenv()
 
+# Force/moment category of each load component, for table lookups
+COMPONENT_CATEGORY = {
+    "fx": "forces",
+    "fy": "forces",
+    "fz": "forces",
+    "mx": "moments",
+    "my": "moments",
+    "mz": "moments",
+}
+
 
 class MCPTestAgentStdio:
     """
@@ -36,8 +50,11 @@ class MCPTestAgentStdio:
 
     def __init__(self):
         """Initialize the agent with MCP server connection."""
-        self.mcp_server: MCPServerStdio
-        self.agent: Agent
+        from pydantic_ai import Agent
+        from pydantic_ai.mcp import MCPServerStdio
+
+        self.mcp_server: "MCPServerStdio"
+        self.agent: "Agent"
 
         self.mcp_server = MCPServerStdio(
             "/opt/homebrew/bin/uv",
@@ -74,8 +91,11 @@ class MCPTestAgentHTTP:
 
     def __init__(self):
         """Initialize the agent with MCP server HTTP connection."""
-        self.mcp_server: MCPServerStreamableHTTP
-        self.agent: Agent
+        from pydantic_ai import Agent
+        from pydantic_ai.mcp import MCPServerStreamableHTTP
+
+        self.mcp_server: "MCPServerStreamableHTTP"
+        self.agent: "Agent"
         self.server_process = None
 
         # Use HTTP transport with the server running on default port
@@ -148,6 +168,22 @@ def extract_force_value(ansys_content: str, component: str) -> float | None:
     return None
 
 
+def output_text(result) -> str:
+    """
+    Return the agent output as a single lowercased string.
+
+    Lowercase once per run so keyword assertions don't re-copy the output
+    for every substring check.
+
+    Args:
+        result: Agent run result
+
+    Returns:
+        str: Lowercased agent output
+    """
+    return str(result.output).lower()
+
+
 def calculate_expected_values(
     original_values: dict[str, float], factor: float
 ) -> dict[str, float]:
@@ -162,20 +198,16 @@ def calculate_expected_values(
         Dict with expected values in klbf/lbf-ft
     """
     # Conversion factors from loads.py
-    force_conversion = 1.0 / 4448.222  # N to klbf
-    moment_conversion = 1.0 / 1.355818  # Nm to lbf-ft
+    conversion = {
+        "forces": 1.0 / 4448.222,  # N to klbf
+        "moments": 1.0 / 1.355818,  # Nm to lbf-ft
+    }
 
     expected = {}
 
     for component, original_value in original_values.items():
         scaled_value = original_value * factor
-
-        if component in ["fx", "fy", "fz"]:
-            # Force components
-            expected[component] = scaled_value * force_conversion
-        else:
-            # Moment components (mx, my, mz)
-            expected[component] = scaled_value * moment_conversion
+        expected[component] = scaled_value * conversion[COMPONENT_CATEGORY[component]]
 
     return expected
 
@@ -271,8 +303,10 @@ class TestMCPStdioIntegration:
         expected_values = calculate_expected_values(original_values, 1.5)
 
         # Validate specific force and moment values
-        tolerance_force = 0.00001  # klbf tolerance
-        tolerance_moment = 0.001  # lbf-ft tolerance
+        tolerances = {
+            "forces": 0.00001,  # klbf tolerance
+            "moments": 0.001,  # lbf-ft tolerance
+        }
 
         for component, expected_value in expected_values.items():
             actual_value = extract_force_value(content, component)
@@ -282,10 +316,7 @@ class TestMCPStdioIntegration:
                     f"Could not find {component} value in ANSYS file"
                 )
 
-                if component in ["fx", "fy", "fz"]:
-                    tolerance = tolerance_force
-                else:
-                    tolerance = tolerance_moment
+                tolerance = tolerances[COMPONENT_CATEGORY[component]]
 
                 assert abs(actual_value - expected_value) < tolerance, (
                     f"{component}: expected {expected_value:.6f}, got {actual_value:.6f}, "
@@ -423,10 +454,10 @@ class TestMCPHTTPIntegration:
                 )
 
                 # Verify the result contains information about loading
-                result_text = str(result.output)
-                assert "load" in result_text.lower()
+                result_text = output_text(result)
+                assert "load" in result_text
                 assert any(
-                    keyword in result_text.lower()
+                    keyword in result_text
                     for keyword in ["case", "point", "summary"]
                 )
 
@@ -494,14 +525,12 @@ class TestMCPHTTPIntegration:
                         ansys_content = f.read()
 
                     # Extract values and compare with expected (use percentage-based tolerances)
-                    tolerance_percent_force = (
-                        0.01  # 1% tolerance for forces (high precision expected)
-                    )
-                    tolerance_percent_moment = (
-                        0.01  # 1% tolerance for moments (high precision expected)
-                    )
+                    tolerance_percents = {
+                        "forces": 0.01,  # 1% tolerance for forces (high precision expected)
+                        "moments": 0.01,  # 1% tolerance for moments (high precision expected)
+                    }
 
-                    for component in ["fx", "fy", "fz", "mx", "my", "mz"]:
+                    for component in COMPONENT_CATEGORY:
                         actual_value = extract_force_value(ansys_content, component)
                         expected_value = expected_values[component]
 
@@ -510,10 +539,9 @@ class TestMCPHTTPIntegration:
                         )
 
                         # Use percentage-based tolerance
-                        if component in ["fx", "fy", "fz"]:
-                            tolerance_percent = tolerance_percent_force
-                        else:
-                            tolerance_percent = tolerance_percent_moment
+                        tolerance_percent = tolerance_percents[
+                            COMPONENT_CATEGORY[component]
+                        ]
 
                         # Calculate absolute tolerance based on expected value
                         absolute_tolerance = abs(expected_value) * tolerance_percent
@@ -530,7 +558,7 @@ class TestMCPHTTPIntegration:
                         )
 
                     # Verify the agent's response mentions the operations
-                    result_text = str(result.output).lower()
+                    result_text = output_text(result)
                     assert any(
                         keyword in result_text
                         for keyword in ["load", "scale", "convert", "export"]
@@ -558,11 +586,8 @@ class TestMCPHTTPIntegration:
                 )
 
                 # Verify the result contains load case information
-                result_text = str(result.output)
-                assert (
-                    "load case" in result_text.lower()
-                    or "loadcase" in result_text.lower()
-                )
+                result_text = output_text(result)
+                assert "load case" in result_text or "loadcase" in result_text
 
         except Exception as e:
             pytest.fail(f"HTTP load case selection test failed: {e}")
@@ -587,7 +612,7 @@ class TestMCPHTTPIntegration:
                 )
 
                 # Verify the result mentions unit conversion
-                result_text = str(result.output).lower()
+                result_text = output_text(result)
                 assert any(
                     keyword in result_text
                     for keyword in ["unit", "convert", "kn", "newton"]
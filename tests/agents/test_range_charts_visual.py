@@ -6,45 +6,63 @@ for manual inspection and verification. These tests are marked with @pytest.mark
 and should be run explicitly when chart generation needs to be tested or updated.
 """
 
+import os
 import pytest
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from tools.loads import LoadSet
+if TYPE_CHECKING:
+    from tools.loads import LoadSet
+
+LOADS_DIR = Path(__file__).parent.parent.parent / "use_case_definition" / "data" / "loads"
+
+
+@lru_cache(maxsize=8)
+def _cached_read_json(path_str: str, mtime_ns: int) -> "LoadSet":
+    """Read a LoadSet once per (path, mtime) so repeated reads skip parsing."""
+    # Imported lazily so collecting this module does not pull in matplotlib/numpy
+    from tools.loads import LoadSet
+
+    return LoadSet.read_json(path_str)
+
+
+def read_loadset(path: Path) -> "LoadSet":
+    """Read a LoadSet through the cache, invalidating when the file changes."""
+    return _cached_read_json(str(path.resolve()), path.stat().st_mtime_ns)
 
 
 @pytest.mark.visuals
 class TestRangeChartsVisualGeneration:
     """Visual chart generation tests (marked as 'visuals' - run with: pytest -m visuals)."""
 
-    def setup_method(self):
-        """Set up real data LoadSets."""
-        self.old_loads_path = (
-            Path(__file__).parent.parent.parent
-            / "use_case_definition"
-            / "data"
-            / "loads"
-            / "03_old_loads.json"
-        )
-        self.new_loads_path = (
-            Path(__file__).parent.parent.parent
-            / "use_case_definition"
-            / "data"
-            / "loads"
-            / "03_A_new_loads.json"
-        )
+    @classmethod
+    def setup_class(cls):
+        """Set up real data LoadSets and their comparison once for the class."""
+        cls.old_loads_path = LOADS_DIR / "03_old_loads.json"
+        cls.new_loads_path = LOADS_DIR / "03_A_new_loads.json"
+        cls.old_loadset = read_loadset(cls.old_loads_path)
+        cls.new_loadset = read_loadset(cls.new_loads_path)
+        cls.comparison = cls.old_loadset.compare_to(cls.new_loadset)
 
     @pytest.mark.visuals
     def test_generate_visual_range_charts(self):
         """Generate visual range charts from real data (marked as 'visuals' - run with: pytest -m visuals)."""
-        old_loadset = LoadSet.read_json(self.old_loads_path)
-        new_loadset = LoadSet.read_json(self.new_loads_path)
+        import numpy as np
 
-        comparison = old_loadset.compare_to(new_loadset)
+        old_loadset = self.old_loadset
+        new_loadset = self.new_loadset
+        comparison = self.comparison
 
         # Create visual output directory in tests folder
         visual_output_dir = Path(__file__).parent / "visual_range_charts"
 
-        generated_files = comparison.generate_range_charts(visual_output_dir)
+        # Sequential: with only a couple of points, spawning a process pool
+        # (and re-importing matplotlib in each worker) costs more than it saves.
+        # Fast PNG compression keeps this inspection-only run quick.
+        generated_files = comparison.generate_range_charts(
+            visual_output_dir, png_compress_level=1
+        )
 
         # Verify all files exist and have reasonable sizes
         assert len(generated_files) > 0
@@ -52,109 +70,88 @@ class TestRangeChartsVisualGeneration:
         print(f"\nGenerated visual range charts in: {visual_output_dir}")
         print("Files created:")
 
+        # Collect file sizes with a single directory scan
+        sizes = {
+            entry.name: entry.stat(follow_symlinks=False).st_size
+            for entry in os.scandir(visual_output_dir)
+            if entry.name.endswith(".png")
+        }
+
         for point_name, file_path in generated_files.items():
             path_obj = Path(file_path)
-            assert path_obj.exists()
+            assert path_obj.name in sizes
             assert path_obj.suffix == ".png"
-            file_size_kb = path_obj.stat().st_size / 1024
+            file_size_kb = sizes[path_obj.name] / 1024
             print(f"  {point_name}: {path_obj.name} ({file_size_kb:.1f} KB)")
 
-        # Also generate summary statistics
+        # Also generate summary statistics, one joined block per point, written once
         summary_file = visual_output_dir / "comparison_summary.txt"
-        with open(summary_file, "w") as f:
-            f.write("LoadSet Comparison Summary\n")
-            f.write("=" * 50 + "\n\n")
-            f.write(f"Old LoadSet: {old_loadset.name}\n")
-            f.write(f"New LoadSet: {new_loadset.name}\n")
-            f.write(
-                f"Units: Forces={old_loadset.units.forces}, Moments={old_loadset.units.moments}\n\n"
+        blocks: list[str] = [
+            "\n".join(
+                [
+                    "LoadSet Comparison Summary",
+                    "=" * 50,
+                    "",
+                    f"Old LoadSet: {old_loadset.name}",
+                    f"New LoadSet: {new_loadset.name}",
+                    f"Units: Forces={old_loadset.units.forces}, Moments={old_loadset.units.moments}",
+                    "",
+                ]
             )
-
-            # Calculate range statistics
-            points_data = {}
-            for row in comparison.comparison_rows:
-                if row.point_name not in points_data:
-                    points_data[row.point_name] = {"forces": {}, "moments": {}}
-
-                category = (
-                    "forces" if row.component in ["fx", "fy", "fz"] else "moments"
+        ]
+
+        # Range statistics per point, computed over the comparison arrays.
+        # compare_to emits each max row directly followed by its min row.
+        arrays = comparison.to_arrays()
+        is_max = arrays["type"] == "max"
+        is_min = ~is_max
+        assert np.array_equal(arrays["point_name"][is_max], arrays["point_name"][is_min])
+        assert np.array_equal(arrays["component"][is_max], arrays["component"][is_min])
+
+        points = arrays["point_name"][is_max]
+        components = arrays["component"][is_max]
+        old_max, old_min = arrays["loadset1_value"][is_max], arrays["loadset1_value"][is_min]
+        new_max, new_min = arrays["loadset2_value"][is_max], arrays["loadset2_value"][is_min]
+        max_pct, min_pct = arrays["pct_diff"][is_max], arrays["pct_diff"][is_min]
+        old_range = old_max - old_min
+        new_range = new_max - new_min
+        range_change = np.divide(
+            new_range - old_range,
+            old_range,
+            out=np.zeros_like(old_range),
+            where=old_range != 0,
+        ) * 100
+
+        categories = {
+            "forces": (["fx", "fy", "fz"], old_loadset.units.forces),
+            "moments": (["mx", "my", "mz"], old_loadset.units.moments),
+        }
+        for point_name in np.unique(points):
+            lines = ["", f"{point_name}:", "-" * (len(point_name) + 1)]
+
+            for category, (category_components, unit) in categories.items():
+                lines.append(f"  {category.capitalize()}:")
+                selected = np.flatnonzero(
+                    (points == point_name) & np.isin(components, category_components)
                 )
-                if row.component not in points_data[row.point_name][category]:
-                    points_data[row.point_name][category][row.component] = {}
-
-                points_data[row.point_name][category][row.component][row.type] = {
-                    "old": row.loadset1_value,
-                    "new": row.loadset2_value,
-                    "old_case": row.loadset1_loadcase,
-                    "new_case": row.loadset2_loadcase,
-                    "pct_diff": row.pct_diff,
-                }
-
-            for point_name, data in points_data.items():
-                f.write(f"\n{point_name}:\n")
-                f.write("-" * (len(point_name) + 1) + "\n")
-
-                # Forces
-                f.write("  Forces:\n")
-                for component in ["fx", "fy", "fz"]:
-                    if component in data["forces"]:
-                        comp_data = data["forces"][component]
-                        if "max" in comp_data and "min" in comp_data:
-                            old_range = (
-                                comp_data["max"]["old"] - comp_data["min"]["old"]
-                            )
-                            new_range = (
-                                comp_data["max"]["new"] - comp_data["min"]["new"]
-                            )
-                            range_change = (
-                                ((new_range - old_range) / old_range * 100)
-                                if old_range != 0
-                                else 0
-                            )
-                            f.write(
-                                f"    {component}: Old range={old_range:.4f}{old_loadset.units.forces}, "
-                                f"New range={new_range:.4f}{old_loadset.units.forces}, "
-                                f"Change={range_change:+.1f}%\n"
-                            )
-                            f.write(
-                                f"         Max: {comp_data['max']['old']:.4f} → {comp_data['max']['new']:.4f} "
-                                f"({comp_data['max']['pct_diff']:+.1f}%)\n"
-                            )
-                            f.write(
-                                f"         Min: {comp_data['min']['old']:.4f} → {comp_data['min']['new']:.4f} "
-                                f"({comp_data['min']['pct_diff']:+.1f}%)\n"
-                            )
-
-                # Moments
-                f.write("  Moments:\n")
-                for component in ["mx", "my", "mz"]:
-                    if component in data["moments"]:
-                        comp_data = data["moments"][component]
-                        if "max" in comp_data and "min" in comp_data:
-                            old_range = (
-                                comp_data["max"]["old"] - comp_data["min"]["old"]
-                            )
-                            new_range = (
-                                comp_data["max"]["new"] - comp_data["min"]["new"]
-                            )
-                            range_change = (
-                                ((new_range - old_range) / old_range * 100)
-                                if old_range != 0
-                                else 0
-                            )
-                            f.write(
-                                f"    {component}: Old range={old_range:.4f}{old_loadset.units.moments}, "
-                                f"New range={new_range:.4f}{old_loadset.units.moments}, "
-                                f"Change={range_change:+.1f}%\n"
-                            )
-                            f.write(
-                                f"         Max: {comp_data['max']['old']:.4f} → {comp_data['max']['new']:.4f} "
-                                f"({comp_data['max']['pct_diff']:+.1f}%)\n"
-                            )
-                            f.write(
-                                f"         Min: {comp_data['min']['old']:.4f} → {comp_data['min']['new']:.4f} "
-                                f"({comp_data['min']['pct_diff']:+.1f}%)\n"
-                            )
+                for i in selected:
+                    lines.append(
+                        f"    {components[i]}: Old range={old_range[i]:.4f}{unit}, "
+                        f"New range={new_range[i]:.4f}{unit}, "
+                        f"Change={range_change[i]:+.1f}%"
+                    )
+                    lines.append(
+                        f"         Max: {old_max[i]:.4f} → {new_max[i]:.4f} "
+                        f"({max_pct[i]:+.1f}%)"
+                    )
+                    lines.append(
+                        f"         Min: {old_min[i]:.4f} → {new_min[i]:.4f} "
+                        f"({min_pct[i]:+.1f}%)"
+                    )
+
+            blocks.append("\n".join(lines))
+
+        summary_file.write_text("\n".join(blocks) + "\n")
 
         print(f"  Summary: {summary_file.name}")
         print(
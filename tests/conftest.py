@@ -9,6 +9,7 @@ import sys
 import os
 from pathlib import Path
 import logfire
+import pytest
 from dotenv import load_dotenv
 
 # Add project root directory to Python path for imports
@@ -21,12 +22,25 @@ tools_path = project_root / "tools"
 if str(tools_path) not in sys.path:
     sys.path.insert(0, str(tools_path))
 
-# Load environment variables and configure logfire for the test process
+# Load environment variables for the test process
 load_dotenv()
-token = os.getenv("LOGFIRE_TOKEN")
-logfire.configure(
-    token=token,
-    send_to_logfire=True,
-    environment="test",
-)
-logfire.instrument_pydantic_ai()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _logfire():
+    """
+    Configure logfire once per test session (skip with LOGFIRE_DISABLE=1).
+
+    Spans are only exported, and pydantic-ai only instrumented, when
+    LOGFIRE_SEND=true; by default test runs do no per-span network I/O.
+    """
+    if not os.getenv("LOGFIRE_DISABLE"):
+        send = os.getenv("LOGFIRE_SEND", "false").lower() == "true"
+        logfire.configure(
+            token=os.getenv("LOGFIRE_TOKEN"),
+            send_to_logfire=send,
+            environment="test",
+        )
+        if send:
+            logfire.instrument_pydantic_ai()
+    yield
@@ -0,0 +1,113 @@
+"""
+Shared fixtures for the MCP server tests.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+
+LOADS_DIR = (
+    Path(__file__).parent.parent.parent / "use_case_definition" / "data" / "loads"
+)
+
+# Canonical single-case LoadSet used by the file-based tool tests, serialized once
+TEST_DATA = {
+    "name": "Test LoadSet",
+    "version": 1,
+    "units": {"forces": "N", "moments": "Nm"},
+    "load_cases": [
+        {
+            "name": "Test Case",
+            "point_loads": [
+                {
+                    "name": "Point 1",
+                    "force_moment": {
+                        "fx": 1000.0,
+                        "fy": 2000.0,
+                        "fz": 3000.0,
+                        "mx": 100.0,
+                        "my": 200.0,
+                        "mz": 300.0,
+                    },
+                }
+            ],
+        }
+    ],
+}
+TEST_DATA_BYTES = json.dumps(TEST_DATA).encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def mcp_provider_cls():
+    """LoadSetMCPProvider class, imported on first use rather than at collection."""
+    from tools.mcps.loads_mcp_server import LoadSetMCPProvider
+
+    return LoadSetMCPProvider
+
+
+@pytest.fixture
+def provider(mcp_provider_cls):
+    """Fresh provider for tests that load or mutate state."""
+    return mcp_provider_cls()
+
+
+@pytest.fixture(scope="session")
+def mcp_server():
+    """MCP server built once per session (tool registration is not repeated)."""
+    from tools.mcps.loads_mcp_server import create_mcp_server
+
+    return create_mcp_server()
+
+
+@pytest.fixture(scope="session")
+def mcp_tools(mcp_server) -> dict:
+    """Tool name -> underlying tool function of the session MCP server."""
+    # get_tools is FastMCP's public (async) tool listing; resolve it once here
+    tools = asyncio.run(mcp_server.get_tools())
+    return {name: tool.fn for name, tool in tools.items()}  # type: ignore
+
+
+@pytest.fixture
+def reset_mcp_server(mcp_tools):
+    """Clear the session server's LoadSet state before and after a test."""
+    # All tools are bound methods of the one provider behind the server
+    server_provider = mcp_tools["load_from_json"].__self__
+    server_provider.reset_state()
+    yield
+    server_provider.reset_state()
+
+
+@pytest.fixture(scope="session")
+def valid_loadset_json(tmp_path_factory) -> str:
+    """TEST_DATA written to a JSON file once per session."""
+    path = tmp_path_factory.mktemp("data") / "loadset.json"
+    path.write_bytes(TEST_DATA_BYTES)
+    return str(path)
+
+
+@pytest.fixture
+def loaded_tools(mcp_tools) -> dict:
+    """Session tools with TEST_DATA loaded as the current LoadSet."""
+    # From the in-memory dict: no file read or JSON parse per test
+    load_result = mcp_tools["load_from_data"](TEST_DATA)
+    assert load_result["success"] is True
+    return mcp_tools
+
+
+@pytest.fixture(scope="session")
+def real_loads_data() -> dict:
+    """Real project new/old loads JSON, parsed once per session and shared read-only."""
+    new_loads_path = LOADS_DIR / "03_A_new_loads.json"
+    old_loads_path = LOADS_DIR / "03_old_loads.json"
+
+    # Skip if files don't exist
+    if not new_loads_path.exists() or not old_loads_path.exists():
+        pytest.skip("Real project data files not found")
+
+    return {
+        "new": json.loads(new_loads_path.read_bytes()),
+        "old": json.loads(old_loads_path.read_bytes()),
+    }
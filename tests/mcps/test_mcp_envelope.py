@@ -4,108 +4,123 @@ Tests for MCP server envelope functionality.
 This module tests the envelope tool in the LoadSet MCP server.
 """
 
+import copy
 import pytest
-import tempfile
 import json
-from pathlib import Path
 
-from tools.mcps.loads_mcp_server import LoadSetMCPProvider  # noqa: E402
 
-
-class TestMCPEnvelope:
-    """Test MCP envelope functionality."""
-
-    def setup_method(self):
-        """Set up test environment."""
-        self.provider = LoadSetMCPProvider()
-
-        # Create test LoadSet data with extreme values
-        self.test_loadset_data = {
-            "name": "MCP Test Envelope LoadSet",
-            "version": 1,
-            "description": "Test load set for MCP envelope functionality",
-            "units": {"forces": "N", "moments": "Nm"},
-            "load_cases": [
-                {
-                    "name": "Max_Fx_Case",
-                    "description": "Load case with maximum fx",
-                    "point_loads": [
-                        {
-                            "name": "Point_A",
-                            "force_moment": {
-                                "fx": 1000.0,  # MAX for Point_A fx
-                                "fy": 100.0,
-                                "fz": 50.0,
-                                "mx": 10.0,
-                                "my": 20.0,
-                                "mz": 30.0,
-                            },
+@pytest.fixture(scope="module")
+def test_loadset_data() -> dict:
+    """
+    Test LoadSet data with extreme values, built once per module.
+
+    Shared by reference across tests, so treat it as read-only; a test that
+    needs to modify it should work on a copy.deepcopy.
+    """
+    return {
+        "name": "MCP Test Envelope LoadSet",
+        "version": 1,
+        "description": "Test load set for MCP envelope functionality",
+        "units": {"forces": "N", "moments": "Nm"},
+        "load_cases": [
+            {
+                "name": "Max_Fx_Case",
+                "description": "Load case with maximum fx",
+                "point_loads": [
+                    {
+                        "name": "Point_A",
+                        "force_moment": {
+                            "fx": 1000.0,  # MAX for Point_A fx
+                            "fy": 100.0,
+                            "fz": 50.0,
+                            "mx": 10.0,
+                            "my": 20.0,
+                            "mz": 30.0,
                         },
-                    ],
-                },
-                {
-                    "name": "Min_Fx_Case",
-                    "description": "Load case with negative minimum fx",
-                    "point_loads": [
-                        {
-                            "name": "Point_A",
-                            "force_moment": {
-                                "fx": -500.0,  # MIN for Point_A fx (negative)
-                                "fy": 200.0,  # MAX for Point_A fy
-                                "fz": 75.0,
-                                "mx": 15.0,
-                                "my": 25.0,
-                                "mz": 35.0,
-                            },
+                    },
+                ],
+            },
+            {
+                "name": "Min_Fx_Case",
+                "description": "Load case with negative minimum fx",
+                "point_loads": [
+                    {
+                        "name": "Point_A",
+                        "force_moment": {
+                            "fx": -500.0,  # MIN for Point_A fx (negative)
+                            "fy": 200.0,  # MAX for Point_A fy
+                            "fz": 75.0,
+                            "mx": 15.0,
+                            "my": 25.0,
+                            "mz": 35.0,
                         },
-                    ],
-                },
-                {
-                    "name": "Max_Fz_Case",
-                    "description": "Load case with maximum fz",
-                    "point_loads": [
-                        {
-                            "name": "Point_A",
-                            "force_moment": {
-                                "fx": 200.0,
-                                "fy": 80.0,  # MIN for Point_A fy (positive, won't be included as min)
-                                "fz": 800.0,  # MAX for Point_A fz
-                                "mx": -100.0,  # MIN for Point_A mx (negative)
-                                "my": 10.0,
-                                "mz": 200.0,  # MAX for Point_A mz
-                            },
+                    },
+                ],
+            },
+            {
+                "name": "Max_Fz_Case",
+                "description": "Load case with maximum fz",
+                "point_loads": [
+                    {
+                        "name": "Point_A",
+                        "force_moment": {
+                            "fx": 200.0,
+                            "fy": 80.0,  # MIN for Point_A fy (positive, won't be included as min)
+                            "fz": 800.0,  # MAX for Point_A fz
+                            "mx": -100.0,  # MIN for Point_A mx (negative)
+                            "my": 10.0,
+                            "mz": 200.0,  # MAX for Point_A mz
                         },
-                    ],
-                },
-                {
-                    "name": "No_Extremes_Case",
-                    "description": "Load case with no extreme values",
-                    "point_loads": [
-                        {
-                            "name": "Point_A",
-                            "force_moment": {
-                                "fx": 300.0,  # Between min and max
-                                "fy": 150.0,  # Between min and max
-                                "fz": 100.0,  # Between min and max
-                                "mx": 12.0,  # Between min and max
-                                "my": 15.0,  # Between min and max
-                                "mz": 100.0,  # Between min and max
-                            },
+                    },
+                ],
+            },
+            {
+                "name": "No_Extremes_Case",
+                "description": "Load case with no extreme values",
+                "point_loads": [
+                    {
+                        "name": "Point_A",
+                        "force_moment": {
+                            "fx": 300.0,  # Between min and max
+                            "fy": 150.0,  # Between min and max
+                            "fz": 100.0,  # Between min and max
+                            "mx": 12.0,  # Between min and max
+                            "my": 15.0,  # Between min and max
+                            "mz": 100.0,  # Between min and max
                         },
-                    ],
-                },
-            ],
-        }
+                    },
+                ],
+            },
+        ],
+    }
 
-    def test_envelope_loadset_success(self):
-        """Test successful envelope operation."""
-        # Load the test data first
-        load_result = self.provider.load_from_data(self.test_loadset_data)
-        assert load_result["success"] is True
 
-        # Create envelope
-        envelope_result = self.provider.envelope_loadset()
+@pytest.fixture(scope="module")
+def test_loadset_json(test_loadset_data, tmp_path_factory) -> str:
+    """Test LoadSet data serialized to a JSON file once per module."""
+    path = tmp_path_factory.mktemp("envelope") / "loadset.json"
+    path.write_text(json.dumps(test_loadset_data))
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def envelope_result(mcp_provider_cls, test_loadset_data) -> dict:
+    """Envelope the default test data once for the read-only response tests."""
+    provider = mcp_provider_cls()
+    load_result = provider.load_from_data(test_loadset_data)
+    assert load_result["success"] is True
+    return provider.envelope_loadset()
 
+
+class TestMCPEnvelope:
+    """Test MCP envelope functionality."""
+
+    # Load cases the envelope of the default test data must keep / drop
+    _EXPECTED_ENVELOPE_NAMES = frozenset({"Max_Fx_Case", "Min_Fx_Case", "Max_Fz_Case"})
+    _EXCLUDED_NAMES = frozenset({"No_Extremes_Case"})
+
+    def test_envelope_loadset_success(self, envelope_result):
+        """Test successful envelope operation."""
         # Validate response
         assert envelope_result["success"] is True
         assert "message" in envelope_result
@@ -120,41 +135,39 @@ class TestMCPEnvelope:
 
         # Check envelope case names
         envelope_case_names = set(envelope_result["envelope_case_names"])
-        assert "Max_Fx_Case" in envelope_case_names
-        assert "Min_Fx_Case" in envelope_case_names
-        assert "Max_Fz_Case" in envelope_case_names
-        assert "No_Extremes_Case" not in envelope_case_names
-
-    def test_envelope_loadset_no_loadset_loaded(self):
-        """Test envelope operation when no LoadSet is loaded."""
-        # Try to create envelope without loading data first
-        envelope_result = self.provider.envelope_loadset()
-
-        # Should return error
-        assert envelope_result["success"] is False
-        assert "No LoadSet loaded" in envelope_result["error"]
-
-    def test_envelope_loadset_empty_loadset(self):
-        """Test envelope operation with empty LoadSet."""
-        empty_loadset_data = {
-            "name": "Empty LoadSet",
-            "version": 1,
-            "units": {"forces": "N", "moments": "Nm"},
-            "load_cases": [],
-        }
-
-        # Load empty data
-        load_result = self.provider.load_from_data(empty_loadset_data)
-        assert load_result["success"] is True
+        assert self._EXPECTED_ENVELOPE_NAMES <= envelope_case_names
+        assert envelope_case_names.isdisjoint(self._EXCLUDED_NAMES)
+
+    @pytest.mark.parametrize(
+        "loadset_data, expected_error",
+        [
+            pytest.param(None, "No LoadSet loaded", id="no_loadset_loaded"),
+            pytest.param(
+                {
+                    "name": "Empty LoadSet",
+                    "version": 1,
+                    "units": {"forces": "N", "moments": "Nm"},
+                    "load_cases": [],
+                },
+                "Cannot create envelope of empty LoadSet",
+                id="empty_loadset",
+            ),
+        ],
+    )
+    def test_envelope_loadset_errors(self, provider, loadset_data, expected_error):
+        """Test envelope operation with no LoadSet loaded or an empty LoadSet."""
+        if loadset_data is not None:
+            load_result = provider.load_from_data(loadset_data)
+            assert load_result["success"] is True
 
         # Try to create envelope
-        envelope_result = self.provider.envelope_loadset()
+        envelope_result = provider.envelope_loadset()
 
-        # Should return error from envelope method
+        # Should return error
         assert envelope_result["success"] is False
-        assert "Cannot create envelope of empty LoadSet" in envelope_result["error"]
+        assert expected_error in envelope_result["error"]
 
-    def test_envelope_loadset_single_case(self):
+    def test_envelope_loadset_single_case(self, provider):
         """Test envelope operation with single load case."""
         single_case_data = {
             "name": "Single Case LoadSet",
@@ -178,11 +191,11 @@ class TestMCPEnvelope:
         }
 
         # Load single case data
-        load_result = self.provider.load_from_data(single_case_data)
+        load_result = provider.load_from_data(single_case_data)
         assert load_result["success"] is True
 
         # Create envelope
-        envelope_result = self.provider.envelope_loadset()
+        envelope_result = provider.envelope_loadset()
 
         # Should succeed and include the single case
         assert envelope_result["success"] is True
@@ -191,7 +204,7 @@ class TestMCPEnvelope:
         assert envelope_result["reduction_ratio"] == 0.0  # No reduction
         assert envelope_result["envelope_case_names"] == ["Only_Case"]
 
-    def test_envelope_loadset_all_positive_values(self):
+    def test_envelope_loadset_all_positive_values(self, provider):
         """Test envelope operation when all values are positive."""
         positive_data = {
             "name": "All Positive LoadSet",
@@ -237,11 +250,11 @@ class TestMCPEnvelope:
         }
 
         # Load positive data
-        load_result = self.provider.load_from_data(positive_data)
+        load_result = provider.load_from_data(positive_data)
         assert load_result["success"] is True
 
         # Create envelope
-        envelope_result = self.provider.envelope_loadset()
+        envelope_result = provider.envelope_loadset()
 
         # Should succeed and only include cases with max values (no negative mins)
         assert envelope_result["success"] is True
@@ -249,64 +262,58 @@ class TestMCPEnvelope:
         # Should have fewer cases since positive mins are not included
         assert envelope_result["envelope_load_cases"] <= 3
 
-    def test_envelope_loadset_preserves_state(self):
+    def test_envelope_loadset_preserves_state(self, provider, test_loadset_data):
         """Test that envelope operation updates the provider state correctly."""
         # Load the test data first
-        load_result = self.provider.load_from_data(self.test_loadset_data)
+        load_result = provider.load_from_data(test_loadset_data)
         assert load_result["success"] is True
 
         # Get initial summary
-        initial_summary = self.provider.get_load_summary()
+        initial_summary = provider.get_load_summary()
         assert initial_summary["num_load_cases"] == 4
 
         # Create envelope
-        envelope_result = self.provider.envelope_loadset()
+        envelope_result = provider.envelope_loadset()
         assert envelope_result["success"] is True
 
         # Get summary after envelope - should show reduced number of cases
-        after_summary = self.provider.get_load_summary()
+        after_summary = provider.get_load_summary()
         assert after_summary["num_load_cases"] == 3
 
         # List load cases to verify the correct ones remain
-        case_list = self.provider.list_load_cases()
+        case_list = provider.list_load_cases()
         case_names = {case["name"] for case in case_list["load_cases"]}
 
-        assert "Max_Fx_Case" in case_names
-        assert "Min_Fx_Case" in case_names
-        assert "Max_Fz_Case" in case_names
-        assert "No_Extremes_Case" not in case_names
+        assert self._EXPECTED_ENVELOPE_NAMES <= case_names
+        assert case_names.isdisjoint(self._EXCLUDED_NAMES)
 
-    def test_envelope_loadset_with_file_input(self):
+    @pytest.mark.io
+    def test_envelope_loadset_with_file_input(self, provider, test_loadset_json):
         """Test envelope operation when data is loaded from file."""
-        # Create temporary JSON file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(self.test_loadset_data, f)
-            temp_file = f.name
-
-        try:
-            # Load from file
-            load_result = self.provider.load_from_json(Path(temp_file))
-            assert load_result["success"] is True
+        # Load from the module-level JSON file
+        load_result = provider.load_from_json(test_loadset_json)
+        assert load_result["success"] is True
 
-            # Create envelope
-            envelope_result = self.provider.envelope_loadset()
-            assert envelope_result["success"] is True
-            assert envelope_result["original_load_cases"] == 4
-            assert envelope_result["envelope_load_cases"] == 3
+        # Create envelope
+        envelope_result = provider.envelope_loadset()
+        assert envelope_result["success"] is True
+        assert envelope_result["original_load_cases"] == 4
+        assert envelope_result["envelope_load_cases"] == 3
 
-        finally:
-            # Clean up
-            Path(temp_file).unlink()
+    def test_envelope_loadset_does_not_mutate_input(self, provider, test_loadset_data):
+        """Test that loading and enveloping leave the shared input data untouched."""
+        original = copy.deepcopy(test_loadset_data)
 
-    def test_envelope_loadset_response_format(self):
-        """Test that envelope response has the correct format."""
-        # Load test data
-        load_result = self.provider.load_from_data(self.test_loadset_data)
+        load_result = provider.load_from_data(test_loadset_data)
         assert load_result["success"] is True
+        envelope_result = provider.envelope_loadset()
+        assert envelope_result["success"] is True
 
-        # Create envelope
-        envelope_result = self.provider.envelope_loadset()
+        # The module-scoped data is shared read-only across tests
+        assert test_loadset_data == original
 
+    def test_envelope_loadset_response_format(self, envelope_result):
+        """Test that envelope response has the correct format."""
         # Validate response structure
         assert isinstance(envelope_result, dict)
         assert "success" in envelope_result
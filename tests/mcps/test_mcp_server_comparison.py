@@ -4,48 +4,36 @@ Tests for MCP server comparison functionality.
 This module tests the new LoadSet comparison tools added to the MCP server.
 """
 
-import tempfile
+import base64
+import json
 import os
 from pathlib import Path
 
-from tools.mcps.loads_mcp_server import create_mcp_server, reset_global_state
+import pytest
 
+from tests.test_utils import COMPARISON_TOOLS, assert_error
 
+
+@pytest.mark.io
+@pytest.mark.usefixtures("reset_mcp_server")
 class TestMCPServerComparison:
     """Test class for MCP server comparison functionality."""
 
-    def setup_method(self):
-        """Set up test environment."""
-        # Reset global state before each test
-        reset_global_state()
-
-        # Create MCP server instance
-        self.mcp = create_mcp_server()
+    # Repo root, for resolving the relative data paths the tests pass
+    repo_root = Path(__file__).parent.parent.parent
 
-        # Create temporary directory for test outputs
-        self.temp_dir = tempfile.mkdtemp()
-
-        # Set up repo root for absolute paths
-        self.repo_root = Path(__file__).parent.parent.parent
+    @pytest.fixture(autouse=True)
+    def _setup(self, mcp_tools, tmp_path):
+        """Set up tools and a per-test output directory."""
+        self.tools = mcp_tools
+        self.temp_dir = str(tmp_path)
 
     def call_tool(self, tool_name: str, **kwargs):
         """Helper method to call MCP tools."""
         # Convert relative file paths to absolute paths
         if "file_path" in kwargs and not Path(kwargs["file_path"]).is_absolute():
             kwargs["file_path"] = str(self.repo_root / kwargs["file_path"])
-        tool_func = self.mcp._tool_manager._tools[tool_name].fn  # type: ignore
-        return tool_func(**kwargs)
-
-    def teardown_method(self):
-        """Clean up test environment."""
-        # Clean up temporary directory
-        if os.path.exists(self.temp_dir):
-            import shutil
-
-            shutil.rmtree(self.temp_dir)
-
-        # Reset global state after each test
-        reset_global_state()
+        return self.tools[tool_name](**kwargs)
 
     def test_load_second_loadset_success(self):
         """Test loading a second LoadSet for comparison."""
@@ -74,8 +62,7 @@ class TestMCPServerComparison:
             "load_second_loadset", file_path="nonexistent_file.json"
         )
 
-        assert result["success"] is False
-        assert "error" in result
+        assert_error(result)
 
     def test_compare_loadsets_success(self):
         """Test successful LoadSet comparison."""
@@ -104,8 +91,7 @@ class TestMCPServerComparison:
         """Test comparison without current LoadSet loaded."""
         result = self.call_tool("compare_loadsets")
 
-        assert result["success"] is False
-        assert "No current LoadSet loaded" in result["error"]
+        assert_error(result, "No current LoadSet loaded")
 
     def test_compare_loadsets_no_comparison_loadset(self):
         """Test comparison without comparison LoadSet loaded."""
@@ -117,8 +103,7 @@ class TestMCPServerComparison:
 
         result = self.call_tool("compare_loadsets")
 
-        assert result["success"] is False
-        assert "No comparison LoadSet loaded" in result["error"]
+        assert_error(result, "No comparison LoadSet loaded")
 
     def test_get_comparison_summary_success(self):
         """Test getting comparison summary."""
@@ -159,8 +144,7 @@ class TestMCPServerComparison:
         """Test getting summary without comparison."""
         result = self.call_tool("get_comparison_summary")
 
-        assert result["success"] is False
-        assert "No comparison available" in result["error"]
+        assert_error(result, "No comparison available")
 
     def test_export_comparison_json_success(self):
         """Test exporting comparison to JSON file."""
@@ -186,8 +170,6 @@ class TestMCPServerComparison:
         # Verify file was created and contains valid JSON
         assert os.path.exists(json_file)
         with open(json_file, "r") as f:
-            import json
-
             data = json.load(f)
             assert "comparisons" in data
 
@@ -196,8 +178,7 @@ class TestMCPServerComparison:
         json_file = os.path.join(self.temp_dir, "comparison.json")
         result = self.call_tool("export_comparison_json", file_path=json_file)
 
-        assert result["success"] is False
-        assert "No comparison available" in result["error"]
+        assert_error(result, "No comparison available")
 
     def test_generate_comparison_charts_as_files(self):
         """Test generating comparison charts as files."""
@@ -273,8 +254,6 @@ class TestMCPServerComparison:
             )
 
             # Verify it's valid base64 by trying to decode it
-            import base64
-
             try:
                 decoded_bytes = base64.b64decode(base64_string)
                 assert len(decoded_bytes) > 0, (
@@ -287,8 +266,7 @@ class TestMCPServerComparison:
         """Test generating charts without comparison."""
         result = self.call_tool("generate_comparison_charts", output_dir=self.temp_dir)
 
-        assert result["success"] is False
-        assert "No comparison available" in result["error"]
+        assert_error(result, "No comparison available")
 
     def test_generate_comparison_charts_missing_output_dir(self):
         """Test generating charts as files without output directory."""
@@ -306,8 +284,7 @@ class TestMCPServerComparison:
         # Try to generate charts without output_dir
         result = self.call_tool("generate_comparison_charts", as_images=False)
 
-        assert result["success"] is False
-        assert "output_dir required when as_images=False" in result["error"]
+        assert_error(result, "output_dir required when as_images=False")
 
     def test_complete_comparison_workflow(self):
         """Test complete comparison workflow."""
@@ -362,32 +339,7 @@ class TestMCPServerComparison:
 class TestMCPServerComparisonToolList:
     """Test that comparison tools are properly registered."""
 
-    def test_server_has_comparison_tools(self):
+    def test_server_has_comparison_tools(self, mcp_tools):
         """Test that MCP server includes all comparison tools."""
-        mcp = create_mcp_server()
-
-        # Get list of available tools
-        tool_names = list(mcp._tool_manager._tools.keys())
-
-        # Check that all comparison tools are present
-        expected_tools = [
-            "load_from_json",
-            "convert_units",
-            "scale_loads",
-            "export_to_ansys",
-            "get_load_summary",
-            "list_load_cases",
-            "load_second_loadset",
-            "compare_loadsets",
-            "generate_comparison_charts",
-            "export_comparison_json",
-            "get_comparison_summary",
-        ]
-
-        for tool_name in expected_tools:
-            assert tool_name in tool_names, (
-                f"Tool {tool_name} not found in server tools"
-            )
-
-        # Verify total count includes all tools
-        assert len(tool_names) >= len(expected_tools)
+        missing = sorted(COMPARISON_TOOLS - mcp_tools.keys())
+        assert not missing, f"Tools not found in server: {missing}"
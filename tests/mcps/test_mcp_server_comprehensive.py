@@ -7,17 +7,17 @@ This module consolidates all MCP server tests including:
 - Envelope functionality
 """
 
+import base64
 import pytest
-import tempfile
 import json
 import os
 from pathlib import Path
 
-from tools.mcps.loads_mcp_server import (
-    create_mcp_server,
-    reset_global_state,
-    LoadSetMCPProvider,
-)
+from tests.test_utils import COMPARISON_TOOLS, EXPECTED_TOOLS, assert_error
+
+
+# Isolate tests sharing the session-scoped MCP server
+pytestmark = pytest.mark.usefixtures("reset_mcp_server")
 
 
 # =============================================================================
@@ -25,77 +25,36 @@ from tools.mcps.loads_mcp_server import (
 # =============================================================================
 
 
+@pytest.mark.smoke
 class TestMCPServerCreation:
     """Test MCP server creation and configuration."""
 
-    def test_create_mcp_server(self):
+    def test_create_mcp_server(self, mcp_server):
         """Test that MCP server can be created."""
-        server = create_mcp_server()
+        server = mcp_server
         assert server is not None
         assert server.name == "LoadSet MCP Server"
 
-    def test_server_has_required_tools(self):
+    def test_server_has_required_tools(self, mcp_tools):
         """Test that server has all required tools registered."""
-        server = create_mcp_server()
+        missing = sorted(EXPECTED_TOOLS - mcp_tools.keys())
+        assert not missing, f"Tools not found in server: {missing}"
 
-        # Expected tools
-        expected_tools = [
-            "load_from_json",
-            "load_from_data",
-            "convert_units",
-            "scale_loads",
-            "export_to_ansys",
-            "get_load_summary",
-            "list_load_cases",
-            "load_second_loadset",
-            "load_second_loadset_from_data",
-            "compare_loadsets",
-            "generate_comparison_charts",
-            "export_comparison_json",
-            "get_comparison_summary",
-            "envelope_loadset",
-        ]
-
-        # Get registered tools from the internal tool manager
-        tool_names = list(server._tool_manager._tools.keys())
-
-        for expected_tool in expected_tools:
-            assert expected_tool in tool_names, (
-                f"Tool {expected_tool} not found in server"
-            )
-
-    def test_server_configuration(self):
+    def test_server_configuration(self, mcp_server):
         """Test server configuration and metadata."""
-        server = create_mcp_server()
+        server = mcp_server
 
         # Test server metadata
         assert hasattr(server, "name")
         assert server.name == "LoadSet MCP Server"
 
 
-class TestMCPServerImport:
-    """Test MCP server import functionality."""
-
-    def test_fastmcp_import(self):
-        """Test that FastMCP can be imported."""
-        from fastmcp import FastMCP
-
-        assert FastMCP is not None
-
-    def test_mcp_server_import(self):
-        """Test that loads_mcp_server module can be imported."""
-        import mcps.loads_mcp_server as mcp_server
-
-        assert hasattr(mcp_server, "create_mcp_server")
-
-
+@pytest.mark.io
 class TestLoadFromJsonTool:
     """Test load_from_json MCP tool functionality."""
 
-    def test_load_valid_json_file(self):
+    def test_load_valid_json_file(self, mcp_tools, tmp_path):
         """Test loading a valid JSON file."""
-        server = create_mcp_server()
-
         # Create a valid LoadSet JSON file
         test_data = {
             "name": "Test LoadSet",
@@ -122,373 +81,194 @@ class TestLoadFromJsonTool:
             ],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(test_data, f)
-            temp_file = f.name
-
-        try:
-            # Get the tool function
-            tool_func = server._tool_manager._tools["load_from_json"].fn  #type: ignore
-
-            # Call the tool
-            result = tool_func(temp_file)
-
-            # Verify the result
-            assert result["success"] is True
-            assert "LoadSet loaded from" in result["message"]
-            assert result["loadset_name"] == "Test LoadSet"
-            assert result["num_load_cases"] == 1
-            assert result["units"]["forces"] == "N"
-            assert result["units"]["moments"] == "Nm"
-
-        finally:
-            # Clean up
-            import os
-
-            os.unlink(temp_file)
-
-    def test_load_nonexistent_file(self):
-        """Test loading a non-existent file."""
-        server = create_mcp_server()
+        temp_file = tmp_path / "loadset.json"
+        temp_file.write_text(json.dumps(test_data))
 
         # Get the tool function
-        tool_func = server._tool_manager._tools["load_from_json"].fn  #type: ignore
+        tool_func = mcp_tools["load_from_json"]
 
-        # Call the tool with non-existent file
-        result = tool_func("/path/that/does/not/exist.json")
+        # Call the tool
+        result = tool_func(temp_file)
 
-        # Verify the error result
-        assert result["success"] is False
-        assert "error" in result
-        assert "File not found" in result["error"]
-
-    def test_load_invalid_json(self):
-        """Test loading an invalid JSON file."""
-        server = create_mcp_server()
-
-        # Create an invalid JSON file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("{ invalid json content")
-            temp_file = f.name
-
-        try:
-            # Get the tool function
-            tool_func = server._tool_manager._tools["load_from_json"].fn  #type: ignore
-
-            # Call the tool
-            result = tool_func(temp_file)
-
-            # Verify the error result
-            assert result["success"] is False
-            assert "error" in result
-
-        finally:
-            # Clean up
-            import os
-
-            os.unlink(temp_file)
-
-    def test_load_invalid_loadset_data(self):
-        """Test loading JSON with invalid LoadSet structure."""
-        server = create_mcp_server()
-
-        # Create JSON with invalid LoadSet structure
-        invalid_data = {"invalid_field": "test", "missing_required_fields": True}
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(invalid_data, f)
-            temp_file = f.name
-
-        try:
-            # Get the tool function
-            tool_func = server._tool_manager._tools["load_from_json"].fn  #type: ignore
-
-            # Call the tool
-            result = tool_func(temp_file)
+        # Verify the result
+        assert result["success"] is True
+        assert "LoadSet loaded from" in result["message"]
+        assert result["loadset_name"] == "Test LoadSet"
+        assert result["num_load_cases"] == 1
+        assert result["units"]["forces"] == "N"
+        assert result["units"]["moments"] == "Nm"
 
-            # Verify the error result
-            assert result["success"] is False
-            assert "error" in result
-            assert "Invalid LoadSet data" in result["error"]
 
-        finally:
-            # Clean up
-            import os
+@pytest.mark.parametrize(
+    "tool_name, payload, expected_error",
+    [
+        pytest.param("load_from_data", {}, None, id="data_empty"),
+        pytest.param(
+            "load_from_data",
+            {"invalid_field": "test", "missing_required": True},
+            None,
+            id="data_invalid",
+        ),
+        pytest.param(
+            "load_second_loadset_from_data",
+            {"invalid_field": "test"},
+            None,
+            id="second_data_invalid",
+        ),
+        pytest.param(
+            "load_from_json",
+            None,
+            "File not found",
+            id="file_nonexistent",
+            marks=pytest.mark.io,
+        ),
+        pytest.param(
+            "load_from_json",
+            "{ invalid json content",
+            None,
+            id="file_invalid_json",
+            marks=pytest.mark.io,
+        ),
+        pytest.param(
+            "load_from_json",
+            json.dumps({"invalid_field": "test", "missing_required_fields": True}),
+            "Invalid LoadSet data",
+            id="file_invalid_loadset_data",
+            marks=pytest.mark.io,
+        ),
+    ],
+)
+def test_load_failure_modes(mcp_tools, tmp_path, tool_name, payload, expected_error):
+    """Test that the load tools report missing, malformed and invalid input."""
+    if tool_name == "load_from_json":
+        # File contents; None leaves the file missing
+        argument = tmp_path / "loadset.json"
+        if payload is not None:
+            argument.write_text(payload)
+    else:
+        argument = payload
 
-            os.unlink(temp_file)
+    assert_error(mcp_tools[tool_name](argument), expected_error)
 
 
 class TestConvertUnitsTool:
     """Test convert_units MCP tool functionality."""
 
-    def setup_method(self):
-        """Set up test data for each test method."""
-        reset_global_state()  # Reset state before each test
-        self.server = create_mcp_server()
-        self.load_tool = self.server._tool_manager._tools["load_from_json"].fn  #type: ignore
-        self.convert_tool = self.server._tool_manager._tools["convert_units"].fn  #type: ignore
-
-        # Create test LoadSet data
-        self.test_data = {
-            "name": "Test LoadSet",
-            "version": 1,
-            "units": {"forces": "N", "moments": "Nm"},
-            "load_cases": [
-                {
-                    "name": "Test Case",
-                    "point_loads": [
-                        {
-                            "name": "Point 1",
-                            "force_moment": {
-                                "fx": 1000.0,
-                                "fy": 2000.0,
-                                "fz": 3000.0,
-                                "mx": 100.0,
-                                "my": 200.0,
-                                "mz": 300.0,
-                            },
-                        }
-                    ],
-                }
-            ],
-        }
-
-    def teardown_method(self):
-        """Clean up after each test method."""
-        reset_global_state()  # Reset state after each test
-
-    def test_convert_units_success(self):
+    def test_convert_units_success(self, mcp_tools, loaded_tools):
         """Test successful unit conversion."""
-        # First load a LoadSet
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(self.test_data, f)
-            temp_file = f.name
-
-        try:
-            # Load the LoadSet
-            load_result = self.load_tool(temp_file)
-            assert load_result["success"] is True
-
-            # Convert units from N to kN
-            convert_result = self.convert_tool("kN")
-
-            # Verify the conversion result
-            assert convert_result["success"] is True
-            assert "Units converted from N to kN" in convert_result["message"]
-            assert convert_result["new_units"]["forces"] == "kN"
-            assert convert_result["new_units"]["moments"] == "kNm"
-
-        finally:
-            import os
+        # Convert units from N to kN
+        convert_result = mcp_tools["convert_units"]("kN")
 
-            os.unlink(temp_file)
+        # Verify the conversion result
+        assert convert_result["success"] is True
+        assert "Units converted from N to kN" in convert_result["message"]
+        assert convert_result["new_units"]["forces"] == "kN"
+        assert convert_result["new_units"]["moments"] == "kNm"
 
-    def test_convert_units_no_loadset(self):
+    def test_convert_units_no_loadset(self, mcp_tools):
         """Test convert_units without loading a LoadSet first."""
-        # Reset global state explicitly
-        reset_global_state()
-
         # Try to convert units without loading a LoadSet
-        result = self.convert_tool("kN")
+        result = mcp_tools["convert_units"]("kN")
 
         # Verify the error result
-        assert result["success"] is False
-        assert "No LoadSet loaded" in result["error"]
+        assert_error(result, "No LoadSet loaded")
 
-    def test_convert_units_invalid_units(self):
+    def test_convert_units_invalid_units(self, mcp_tools, loaded_tools):
         """Test conversion with invalid units."""
-        # First load a LoadSet
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(self.test_data, f)
-            temp_file = f.name
-
-        try:
-            # Load the LoadSet
-            load_result = self.load_tool(temp_file)
-            assert load_result["success"] is True
-
-            # Try to convert to invalid units
-            convert_result = self.convert_tool("invalid_unit")
+        # Try to convert to invalid units
+        convert_result = mcp_tools["convert_units"]("invalid_unit")
 
-            # Verify the error result
-            assert convert_result["success"] is False
-            assert "error" in convert_result
-
-        finally:
-            import os
-
-            os.unlink(temp_file)
+        # Verify the error result
+        assert_error(convert_result)
 
-    def test_convert_units_multiple_conversions(self):
+    def test_convert_units_multiple_conversions(self, mcp_tools, loaded_tools):
         """Test multiple unit conversions in sequence."""
-        # First load a LoadSet
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(self.test_data, f)
-            temp_file = f.name
-
-        try:
-            # Load the LoadSet
-            load_result = self.load_tool(temp_file)
-            assert load_result["success"] is True
-
-            # Convert N -> kN
-            result1 = self.convert_tool("kN")
-            assert result1["success"] is True
-            assert result1["new_units"]["forces"] == "kN"
-
-            # Convert kN -> lbf
-            result2 = self.convert_tool("lbf")
-            assert result2["success"] is True
-            assert result2["new_units"]["forces"] == "lbf"
-            assert result2["new_units"]["moments"] == "lbf-ft"
-
-        finally:
-            import os
+        # Convert N -> kN
+        result1 = mcp_tools["convert_units"]("kN")
+        assert result1["success"] is True
+        assert result1["new_units"]["forces"] == "kN"
 
-            os.unlink(temp_file)
+        # Convert kN -> lbf
+        result2 = mcp_tools["convert_units"]("lbf")
+        assert result2["success"] is True
+        assert result2["new_units"]["forces"] == "lbf"
+        assert result2["new_units"]["moments"] == "lbf-ft"
 
 
 class TestScaleLoadsTool:
     """Test scale_loads MCP tool functionality."""
 
-    def setup_method(self):
-        """Set up test data for each test method."""
-        reset_global_state()
-        self.server = create_mcp_server()
-        self.load_tool = self.server._tool_manager._tools["load_from_json"].fn  #type: ignore
-        self.scale_tool = self.server._tool_manager._tools["scale_loads"].fn  #type: ignore
-
-        # Create test LoadSet data
-        self.test_data = {
-            "name": "Test LoadSet",
-            "version": 1,
-            "units": {"forces": "N", "moments": "Nm"},
-            "load_cases": [
-                {
-                    "name": "Test Case",
-                    "point_loads": [
-                        {
-                            "name": "Point 1",
-                            "force_moment": {
-                                "fx": 1000.0,
-                                "fy": 2000.0,
-                                "fz": 3000.0,
-                                "mx": 100.0,
-                                "my": 200.0,
-                                "mz": 300.0,
-                            },
-                        }
-                    ],
-                }
-            ],
-        }
-
-    def teardown_method(self):
-        reset_global_state()
-
-    def test_scale_loads_success(self):
+    def test_scale_loads_success(self, mcp_tools, loaded_tools):
         """Test successful load scaling."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(self.test_data, f)
-            temp_file = f.name
-
-        try:
-            # Load the LoadSet
-            load_result = self.load_tool(temp_file)
-            assert load_result["success"] is True
+        # Scale loads by factor of 2.0
+        scale_result = mcp_tools["scale_loads"](2.0)
 
-            # Scale loads by factor of 2.0
-            scale_result = self.scale_tool(2.0)
+        # Verify the scaling result
+        assert scale_result["success"] is True
+        assert "Loads scaled by factor 2.0" in scale_result["message"]
+        assert scale_result["scaling_factor"] == 2.0
 
-            # Verify the scaling result
-            assert scale_result["success"] is True
-            assert "Loads scaled by factor 2.0" in scale_result["message"]
-            assert scale_result["scaling_factor"] == 2.0
-
-        finally:
-            import os
-
-            os.unlink(temp_file)
-
-    def test_scale_loads_no_loadset(self):
+    def test_scale_loads_no_loadset(self, mcp_tools):
         """Test scale_loads without loading a LoadSet first."""
-        result = self.scale_tool(1.5)
-        assert result["success"] is False
-        assert "No LoadSet loaded" in result["error"]
+        result = mcp_tools["scale_loads"](1.5)
+        assert_error(result, "No LoadSet loaded")
 
 
 class TestDataBasedMethods:
     """Test data-based LoadSet methods (load_from_data, load_second_loadset_from_data)."""
 
-    def setup_method(self):
-        """Set up test data for each test method."""
-        reset_global_state()
-        self.server = create_mcp_server()
-        self.load_from_data_tool = self.server._tool_manager._tools["load_from_data"].fn  #type: ignore
-        self.load_second_from_data_tool = self.server._tool_manager._tools[
-            "load_second_loadset_from_data"
-        ].fn  #type: ignore
-        self.compare_tool = self.server._tool_manager._tools["compare_loadsets"].fn  #type: ignore
-        self.chart_tool = self.server._tool_manager._tools[
-            "generate_comparison_charts"
-        ].fn  #type: ignore
-
-        # Create test LoadSet data
-        self.test_data_1 = {
-            "name": "Test LoadSet 1",
-            "version": 1,
-            "units": {"forces": "N", "moments": "Nm"},
-            "load_cases": [
-                {
-                    "name": "Test Case 1",
-                    "point_loads": [
-                        {
-                            "name": "Point A",
-                            "force_moment": {
-                                "fx": 100.0,
-                                "fy": 200.0,
-                                "fz": 300.0,
-                                "mx": 10.0,
-                                "my": 20.0,
-                                "mz": 30.0,
-                            },
-                        }
-                    ],
-                }
-            ],
-        }
-
-        self.test_data_2 = {
-            "name": "Test LoadSet 2",
-            "version": 1,
-            "units": {"forces": "N", "moments": "Nm"},
-            "load_cases": [
-                {
-                    "name": "Test Case 2",
-                    "point_loads": [
-                        {
-                            "name": "Point A",
-                            "force_moment": {
-                                "fx": 150.0,
-                                "fy": 250.0,
-                                "fz": 350.0,
-                                "mx": 15.0,
-                                "my": 25.0,
-                                "mz": 35.0,
-                            },
-                        }
-                    ],
-                }
-            ],
-        }
-
-    def teardown_method(self):
-        """Clean up after each test method."""
-        reset_global_state()
+    # Test LoadSet data, shared read-only by every test in the class
+    test_data_1 = {
+        "name": "Test LoadSet 1",
+        "version": 1,
+        "units": {"forces": "N", "moments": "Nm"},
+        "load_cases": [
+            {
+                "name": "Test Case 1",
+                "point_loads": [
+                    {
+                        "name": "Point A",
+                        "force_moment": {
+                            "fx": 100.0,
+                            "fy": 200.0,
+                            "fz": 300.0,
+                            "mx": 10.0,
+                            "my": 20.0,
+                            "mz": 30.0,
+                        },
+                    }
+                ],
+            }
+        ],
+    }
+
+    test_data_2 = {
+        "name": "Test LoadSet 2",
+        "version": 1,
+        "units": {"forces": "N", "moments": "Nm"},
+        "load_cases": [
+            {
+                "name": "Test Case 2",
+                "point_loads": [
+                    {
+                        "name": "Point A",
+                        "force_moment": {
+                            "fx": 150.0,
+                            "fy": 250.0,
+                            "fz": 350.0,
+                            "mx": 15.0,
+                            "my": 25.0,
+                            "mz": 35.0,
+                        },
+                    }
+                ],
+            }
+        ],
+    }
 
-    def test_load_from_data_success(self):
+    def test_load_from_data_success(self, mcp_tools):
         """Test successful loading from data."""
-        result = self.load_from_data_tool(self.test_data_1)
+        result = mcp_tools["load_from_data"](self.test_data_1)
 
         assert result["success"] is True
         assert result["message"] == "LoadSet loaded from data"
@@ -497,24 +277,9 @@ class TestDataBasedMethods:
         assert result["units"]["forces"] == "N"
         assert result["units"]["moments"] == "Nm"
 
-    def test_load_from_data_invalid_data(self):
-        """Test loading from invalid data."""
-        invalid_data = {"invalid_field": "test", "missing_required": True}
-        result = self.load_from_data_tool(invalid_data)
-
-        assert result["success"] is False
-        assert "error" in result
-
-    def test_load_from_data_empty_data(self):
-        """Test loading from empty data."""
-        result = self.load_from_data_tool({})
-
-        assert result["success"] is False
-        assert "error" in result
-
-    def test_load_second_loadset_from_data_success(self):
+    def test_load_second_loadset_from_data_success(self, mcp_tools):
         """Test successful loading second loadset from data."""
-        result = self.load_second_from_data_tool(self.test_data_2)
+        result = mcp_tools["load_second_loadset_from_data"](self.test_data_2)
 
         assert result["success"] is True
         assert result["message"] == "Comparison LoadSet loaded from data"
@@ -523,156 +288,132 @@ class TestDataBasedMethods:
         assert result["units"]["forces"] == "N"
         assert result["units"]["moments"] == "Nm"
 
-    def test_load_second_loadset_from_data_invalid_data(self):
-        """Test loading second loadset from invalid data."""
-        invalid_data = {"invalid_field": "test"}
-        result = self.load_second_from_data_tool(invalid_data)
-
-        assert result["success"] is False
-        assert "error" in result
-
-    def test_complete_data_based_workflow(self):
-        """Test complete workflow using data-based methods."""
-        # Load first LoadSet from data
-        result1 = self.load_from_data_tool(self.test_data_1)
-        assert result1["success"] is True
+    @pytest.fixture
+    def compared(self, mcp_tools, reset_mcp_server) -> dict:
+        """Load test_data_1 and test_data_2 from data and compare them."""
+        return {
+            "load1": mcp_tools["load_from_data"](self.test_data_1),
+            "load2": mcp_tools["load_second_loadset_from_data"](self.test_data_2),
+            "comparison": mcp_tools["compare_loadsets"](),
+        }
 
-        # Load second LoadSet from data
-        result2 = self.load_second_from_data_tool(self.test_data_2)
-        assert result2["success"] is True
+    def test_complete_data_based_workflow_compare(self, compared):
+        """Test comparing LoadSets loaded with the data-based methods."""
+        assert compared["load1"]["success"] is True
+        assert compared["load2"]["success"] is True
 
-        # Compare the LoadSets
-        comparison_result = self.compare_tool()
+        comparison_result = compared["comparison"]
         assert comparison_result["success"] is True
         assert comparison_result["loadset1_name"] == "Test LoadSet 1"
         assert comparison_result["loadset2_name"] == "Test LoadSet 2"
         assert comparison_result["total_comparison_rows"] > 0
 
-        # Generate charts
-        chart_result = self.chart_tool(as_images=True, format="png")
+    @pytest.mark.usefixtures("compared")
+    def test_complete_data_based_workflow_charts(self, mcp_tools):
+        """Test generating charts from a data-based comparison."""
+        chart_result = mcp_tools["generate_comparison_charts"](
+            as_images=True, format="png"
+        )
         assert chart_result["success"] is True
         assert "charts" in chart_result
         assert len(chart_result["charts"]) > 0
 
-    def test_mixed_workflow_file_and_data(self):
+    @pytest.mark.io
+    def test_mixed_workflow_file_and_data(self, mcp_tools, tmp_path):
         """Test workflow mixing file-based and data-based methods."""
         # Load first LoadSet from data
-        result1 = self.load_from_data_tool(self.test_data_1)
+        result1 = mcp_tools["load_from_data"](self.test_data_1)
         assert result1["success"] is True
 
         # Load second LoadSet from file (create temporary file)
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(self.test_data_2, f)
-            temp_file = f.name
-
-        try:
-            load_second_tool = self.server._tool_manager._tools[
-                "load_second_loadset"
-            ].fn  #type: ignore
-            result2 = load_second_tool(temp_file)
-            assert result2["success"] is True
-
-            # Compare the LoadSets
-            comparison_result = self.compare_tool()
-            assert comparison_result["success"] is True
+        temp_file = tmp_path / "loadset.json"
+        temp_file.write_text(json.dumps(self.test_data_2))
 
-        finally:
-            import os
-
-            os.unlink(temp_file)
-
-    def test_data_based_with_real_project_data(self):
-        """Test data-based methods with real project data."""
-        # Load real project data
-        new_loads_path = Path("use_case_definition/data/loads/03_A_new_loads.json")
-        old_loads_path = Path("use_case_definition/data/loads/03_old_loads.json")
-
-        # Skip if files don't exist
-        if not new_loads_path.exists() or not old_loads_path.exists():
-            pytest.skip("Real project data files not found")
-
-        # Load the JSON data
-        with open(new_loads_path, "r") as f:
-            new_loads_data = json.load(f)
+        load_second_tool = mcp_tools["load_second_loadset"]
+        result2 = load_second_tool(temp_file)
+        assert result2["success"] is True
 
-        with open(old_loads_path, "r") as f:
-            old_loads_data = json.load(f)
+        # Compare the LoadSets
+        comparison_result = mcp_tools["compare_loadsets"]()
+        assert comparison_result["success"] is True
 
-        # Test load_from_data with real data
-        result1 = self.load_from_data_tool(new_loads_data)
-        assert result1["success"] is True
-        assert result1["loadset_name"] == "Aerospace Structural Load Cases"
-        assert result1["num_load_cases"] == 25
+    @pytest.fixture
+    def real_compared(self, mcp_tools, reset_mcp_server, real_loads_data) -> dict:
+        """Load the real project LoadSets from data and compare them."""
+        return {
+            "load1": mcp_tools["load_from_data"](real_loads_data["new"]),
+            "load2": mcp_tools["load_second_loadset_from_data"](real_loads_data["old"]),
+            "comparison": mcp_tools["compare_loadsets"](),
+        }
 
-        # Test load_second_loadset_from_data with real data
-        result2 = self.load_second_from_data_tool(old_loads_data)
-        assert result2["success"] is True
-        assert result2["loadset_name"] == "Aerospace Structural Load Cases"
-        assert result2["num_load_cases"] == 25
+    @pytest.mark.io
+    def test_data_based_with_real_project_data_compare(self, real_compared):
+        """Test comparing the real project LoadSets loaded from data."""
+        for result in (real_compared["load1"], real_compared["load2"]):
+            assert result["success"] is True
+            assert result["loadset_name"] == "Aerospace Structural Load Cases"
+            assert result["num_load_cases"] == 25
 
-        # Test comparison with real data
-        comparison_result = self.compare_tool()
+        comparison_result = real_compared["comparison"]
         assert comparison_result["success"] is True
         assert comparison_result["total_comparison_rows"] > 0
 
-        # Test chart generation with real data
-        chart_result = self.chart_tool(as_images=True, format="png")
+    @pytest.mark.io
+    @pytest.mark.usefixtures("real_compared")
+    def test_data_based_with_real_project_data_charts(self, mcp_tools):
+        """Test generating charts from the real project comparison."""
+        chart_result = mcp_tools["generate_comparison_charts"](
+            as_images=True, format="png"
+        )
         assert chart_result["success"] is True
         assert "charts" in chart_result
         assert len(chart_result["charts"]) == 2  # Should have Point A and Point B
 
-    def test_data_validation_comprehensive(self):
-        """Test comprehensive data validation scenarios."""
-        # Test missing required fields
-        invalid_scenarios = [
-            {},  # Empty dict
-            {"name": "Test"},  # Missing version, units, load_cases
-            {"name": "Test", "version": 1},  # Missing units, load_cases
-            {
-                "name": "Test",
-                "version": 1,
-                "units": {"forces": "N"},
-            },  # Missing moments unit
-            {
-                "name": "Test",
-                "version": 1,
-                "units": {"forces": "N", "moments": "Nm"},
-            },  # Missing load_cases
-        ]
-
-        for i, invalid_data in enumerate(invalid_scenarios):
-            result = self.load_from_data_tool(invalid_data)
-            assert result["success"] is False, f"Scenario {i} should fail"
-            assert "error" in result, f"Scenario {i} should have error message"
-
-    def test_error_handling_consistency(self):
+    @pytest.mark.parametrize(
+        "invalid_data",
+        [
+            pytest.param({}, id="empty_dict"),
+            pytest.param({"name": "Test"}, id="missing_version_units_load_cases"),
+            pytest.param({"name": "Test", "version": 1}, id="missing_units_load_cases"),
+            pytest.param(
+                {"name": "Test", "version": 1, "units": {"forces": "N"}},
+                id="missing_moments_unit",
+            ),
+            pytest.param(
+                {
+                    "name": "Test",
+                    "version": 1,
+                    "units": {"forces": "N", "moments": "Nm"},
+                },
+                id="missing_load_cases",
+            ),
+        ],
+    )
+    def test_data_validation_comprehensive(self, mcp_tools, invalid_data):
+        """Test that load_from_data rejects LoadSets missing required fields."""
+        result = mcp_tools["load_from_data"](invalid_data)
+        assert_error(result)
+
+    @pytest.mark.io
+    def test_error_handling_consistency(self, mcp_tools, tmp_path):
         """Test that error handling is consistent between file and data methods."""
         # Test with same invalid data structure
         invalid_data = {"invalid": "structure"}
 
         # Test data-based method
-        data_result = self.load_from_data_tool(invalid_data)
-        assert data_result["success"] is False
-        assert "error" in data_result
+        data_result = mcp_tools["load_from_data"](invalid_data)
+        assert_error(data_result)
 
         # Test file-based method with same invalid data
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(invalid_data, f)
-            temp_file = f.name
+        temp_file = tmp_path / "loadset.json"
+        temp_file.write_text(json.dumps(invalid_data))
 
-        try:
-            file_tool = self.server._tool_manager._tools["load_from_json"].fn  #type: ignore
-            file_result = file_tool(temp_file)
-            assert file_result["success"] is False
-            assert "error" in file_result
+        file_tool = mcp_tools["load_from_json"]
+        file_result = file_tool(temp_file)
+        assert_error(file_result)
 
-            # Both should fail (though error messages might be slightly different)
-            # The key is that both fail appropriately
-
-        finally:
-            import os
-
-            os.unlink(temp_file)
+        # Both should fail (though error messages might be slightly different)
+        # The key is that both fail appropriately
 
 
 # =============================================================================
@@ -680,35 +421,19 @@ class TestDataBasedMethods:
 # =============================================================================
 
 
+@pytest.mark.io
 class TestMCPServerComparison:
     """Test class for MCP server comparison functionality."""
 
-    def setup_method(self):
-        """Set up test environment."""
-        # Reset global state before each test
-        reset_global_state()
-
-        # Create MCP server instance
-        self.mcp = create_mcp_server()
-
-        # Create temporary directory for test outputs
-        self.temp_dir = tempfile.mkdtemp()
+    @pytest.fixture(autouse=True)
+    def _setup(self, mcp_tools, tmp_path):
+        """Set up tools and a per-test output directory."""
+        self.tools = mcp_tools
+        self.temp_dir = str(tmp_path)
 
     def call_tool(self, tool_name: str, **kwargs):
         """Helper method to call MCP tools."""
-        tool_func = self.mcp._tool_manager._tools[tool_name].fn  #type: ignore
-        return tool_func(**kwargs)
-
-    def teardown_method(self):
-        """Clean up test environment."""
-        # Clean up temporary directory
-        if os.path.exists(self.temp_dir):
-            import shutil
-
-            shutil.rmtree(self.temp_dir)
-
-        # Reset global state after each test
-        reset_global_state()
+        return self.tools[tool_name](**kwargs)
 
     def test_load_second_loadset_success(self):
         """Test loading a second LoadSet for comparison."""
@@ -737,8 +462,7 @@ class TestMCPServerComparison:
             "load_second_loadset", file_path="nonexistent_file.json"
         )
 
-        assert result["success"] is False
-        assert "error" in result
+        assert_error(result)
 
     def test_compare_loadsets_success(self):
         """Test successful LoadSet comparison."""
@@ -767,8 +491,7 @@ class TestMCPServerComparison:
         """Test comparison without current LoadSet loaded."""
         result = self.call_tool("compare_loadsets")
 
-        assert result["success"] is False
-        assert "No current LoadSet loaded" in result["error"]
+        assert_error(result, "No current LoadSet loaded")
 
     def test_compare_loadsets_no_comparison_loadset(self):
         """Test comparison without comparison LoadSet loaded."""
@@ -780,8 +503,7 @@ class TestMCPServerComparison:
 
         result = self.call_tool("compare_loadsets")
 
-        assert result["success"] is False
-        assert "No comparison LoadSet loaded" in result["error"]
+        assert_error(result, "No comparison LoadSet loaded")
 
     def test_get_comparison_summary_success(self):
         """Test getting comparison summary."""
@@ -822,8 +544,7 @@ class TestMCPServerComparison:
         """Test getting summary without comparison."""
         result = self.call_tool("get_comparison_summary")
 
-        assert result["success"] is False
-        assert "No comparison available" in result["error"]
+        assert_error(result, "No comparison available")
 
     def test_export_comparison_json_success(self):
         """Test exporting comparison to JSON file."""
@@ -849,8 +570,6 @@ class TestMCPServerComparison:
         # Verify file was created and contains valid JSON
         assert os.path.exists(json_file)
         with open(json_file, "r") as f:
-            import json
-
             data = json.load(f)
             assert "comparisons" in data
 
@@ -859,8 +578,7 @@ class TestMCPServerComparison:
         json_file = os.path.join(self.temp_dir, "comparison.json")
         result = self.call_tool("export_comparison_json", file_path=json_file)
 
-        assert result["success"] is False
-        assert "No comparison available" in result["error"]
+        assert_error(result, "No comparison available")
 
     def test_generate_comparison_charts_as_files(self):
         """Test generating comparison charts as files."""
@@ -936,8 +654,6 @@ class TestMCPServerComparison:
             )
 
             # Verify it's valid base64 by trying to decode it
-            import base64
-
             try:
                 decoded_bytes = base64.b64decode(base64_string)
                 assert len(decoded_bytes) > 0, (
@@ -950,8 +666,7 @@ class TestMCPServerComparison:
         """Test generating charts without comparison."""
         result = self.call_tool("generate_comparison_charts", output_dir=self.temp_dir)
 
-        assert result["success"] is False
-        assert "No comparison available" in result["error"]
+        assert_error(result, "No comparison available")
 
     def test_generate_comparison_charts_missing_output_dir(self):
         """Test generating charts as files without output directory."""
@@ -969,8 +684,7 @@ class TestMCPServerComparison:
         # Try to generate charts without output_dir
         result = self.call_tool("generate_comparison_charts", as_images=False)
 
-        assert result["success"] is False
-        assert "output_dir required when as_images=False" in result["error"]
+        assert_error(result, "output_dir required when as_images=False")
 
     def test_complete_comparison_workflow(self):
         """Test complete comparison workflow."""
@@ -1025,48 +739,19 @@ class TestMCPServerComparison:
 class TestMCPServerComparisonToolList:
     """Test that comparison tools are properly registered."""
 
-    def test_server_has_comparison_tools(self):
+    def test_server_has_comparison_tools(self, mcp_tools):
         """Test that MCP server includes all comparison tools."""
-        mcp = create_mcp_server()
-
-        # Get list of available tools
-        tool_names = list(mcp._tool_manager._tools.keys())
-
-        # Check that all comparison tools are present
-        expected_tools = [
-            "load_from_json",
-            "convert_units",
-            "scale_loads",
-            "export_to_ansys",
-            "get_load_summary",
-            "list_load_cases",
-            "load_second_loadset",
-            "compare_loadsets",
-            "generate_comparison_charts",
-            "export_comparison_json",
-            "get_comparison_summary",
-        ]
-
-        for tool_name in expected_tools:
-            assert tool_name in tool_names, (
-                f"Tool {tool_name} not found in server tools"
-            )
-
-        # Verify total count includes all tools
-        assert len(tool_names) >= len(expected_tools)
-
-
-# =============================================================================
-# ENVELOPE FUNCTIONALITY TESTS
-# =============================================================================
+        missing = sorted(COMPARISON_TOOLS - mcp_tools.keys())
+        assert not missing, f"Tools not found in server: {missing}"
 
 
 class TestMCPEnvelope:
     """Test MCP envelope functionality."""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, provider):
         """Set up test environment."""
-        self.provider = LoadSetMCPProvider()
+        self.provider = provider
 
         # Create test LoadSet data with extreme values
         self.test_loadset_data = {
@@ -1180,8 +865,7 @@ class TestMCPEnvelope:
         envelope_result = self.provider.envelope_loadset()
 
         # Should return error
-        assert envelope_result["success"] is False
-        assert "No LoadSet loaded" in envelope_result["error"]
+        assert_error(envelope_result, "No LoadSet loaded")
 
     def test_envelope_loadset_empty_loadset(self):
         """Test envelope operation with empty LoadSet."""
@@ -1200,8 +884,7 @@ class TestMCPEnvelope:
         envelope_result = self.provider.envelope_loadset()
 
         # Should return error from envelope method
-        assert envelope_result["success"] is False
-        assert "Cannot create envelope of empty LoadSet" in envelope_result["error"]
+        assert_error(envelope_result, "Cannot create envelope of empty LoadSet")
 
     def test_envelope_loadset_single_case(self):
         """Test envelope operation with single load case."""
@@ -1325,27 +1008,22 @@ class TestMCPEnvelope:
         assert "Max_Fz_Case" in case_names
         assert "No_Extremes_Case" not in case_names
 
-    def test_envelope_loadset_with_file_input(self):
+    @pytest.mark.io
+    def test_envelope_loadset_with_file_input(self, tmp_path):
         """Test envelope operation when data is loaded from file."""
         # Create temporary JSON file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(self.test_loadset_data, f)
-            temp_file = f.name
-
-        try:
-            # Load from file
-            load_result = self.provider.load_from_json(Path(temp_file))
-            assert load_result["success"] is True
-
-            # Create envelope
-            envelope_result = self.provider.envelope_loadset()
-            assert envelope_result["success"] is True
-            assert envelope_result["original_load_cases"] == 4
-            assert envelope_result["envelope_load_cases"] == 3
-
-        finally:
-            # Clean up
-            Path(temp_file).unlink()
+        temp_file = tmp_path / "loadset.json"
+        temp_file.write_text(json.dumps(self.test_loadset_data))
+
+        # Load from file
+        load_result = self.provider.load_from_json(Path(temp_file))
+        assert load_result["success"] is True
+
+        # Create envelope
+        envelope_result = self.provider.envelope_loadset()
+        assert envelope_result["success"] is True
+        assert envelope_result["original_load_cases"] == 4
+        assert envelope_result["envelope_load_cases"] == 3
 
     def test_envelope_loadset_response_format(self):
         """Test that envelope response has the correct format."""
@@ -6,7 +6,6 @@ across test files.
 """
 
 import os
-import sys
 import tempfile
 import shutil
 from pathlib import Path
@@ -185,6 +184,53 @@ def create_sample_loadset_data() -> dict:
     }
 
 
+# Tools the LoadSet MCP server must register
+EXPECTED_TOOLS = frozenset(
+    {
+        "load_from_json",
+        "load_from_data",
+        "convert_units",
+        "scale_loads",
+        "export_to_ansys",
+        "get_load_summary",
+        "list_load_cases",
+        "load_second_loadset",
+        "load_second_loadset_from_data",
+        "compare_loadsets",
+        "generate_comparison_charts",
+        "export_comparison_json",
+        "get_comparison_summary",
+        "envelope_loadset",
+    }
+)
+
+# The LoadSet comparison subset of EXPECTED_TOOLS
+COMPARISON_TOOLS = frozenset(
+    {
+        "load_second_loadset",
+        "load_second_loadset_from_data",
+        "compare_loadsets",
+        "generate_comparison_charts",
+        "export_comparison_json",
+        "get_comparison_summary",
+    }
+)
+
+
+def assert_error(result: dict, expected_error: str | None = None) -> None:
+    """
+    Assert that an MCP tool result reports failure.
+
+    Args:
+        result: Tool result dictionary
+        expected_error: Optional text the error message should contain
+    """
+    assert result["success"] is False
+    assert "error" in result
+    if expected_error is not None:
+        assert expected_error in result["error"]
+
+
 def assert_valid_ansys_file(file_path: Path, expected_commands: list = None):
     """
     Assert that an ANSYS file has valid format and expected commands.
@@ -1,13 +1,11 @@
 """Tests for the load_balance module."""
 
 import numpy as np
-import pytest
 from tools.load_balance import (
     generate_balanced_loadset,
     _build_equilibrium_matrix,
     _verify_equilibrium,
     DEFAULT_INTERFACES,
-    COMPONENTS,
 )
 from tools.loads import LoadSet
 
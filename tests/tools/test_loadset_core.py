@@ -225,6 +225,26 @@ class TestLoadSetReadJson:
         finally:
             os.unlink(temp_file)
 
+    @pytest.mark.parametrize("parser", ["orjson", "json"])
+    def test_read_json_parser_backends(self, parser, monkeypatch, tmp_path):
+        """Test read_json gives the same result with and without orjson."""
+        import tools.loads
+
+        if parser == "orjson":
+            monkeypatch.setattr(tools.loads, "orjson", pytest.importorskip("orjson"))
+        else:
+            monkeypatch.setattr(tools.loads, "orjson", None)
+
+        valid_file = tmp_path / "valid.json"
+        valid_file.write_text(json.dumps(self.sample_loadset_data))
+        load_set = LoadSet.read_json(valid_file)
+        assert load_set == LoadSet.model_validate(self.sample_loadset_data)
+
+        invalid_file = tmp_path / "invalid.json"
+        invalid_file.write_text("{ invalid json }")
+        with pytest.raises(json.JSONDecodeError):
+            LoadSet.read_json(invalid_file)
+
     def test_read_json_actual_new_loads_file(self):
         """Test reading the actual new_loads file."""
         new_loads_path = (
@@ -1156,6 +1176,45 @@ class TestLoadSetCompare:
         )
         assert len(parsed["comparisons"]) == 1
 
+    def test_loadset_compare_to_arrays(self):
+        """Test LoadSetCompare to_arrays method."""
+        rows = [
+            ComparisonRow(
+                point_name="Point_A",
+                component="fx",
+                type=row_type,
+                loadset1_value=value1,
+                loadset2_value=value2,
+                loadset1_loadcase="Case1",
+                loadset2_loadcase="Case2",
+                abs_diff=abs(value2 - value1),
+                pct_diff=abs(value2 - value1) / abs(value1) * 100.0,
+            )
+            for row_type, value1, value2 in [("max", 100.0, 120.0), ("min", 80.0, 90.0)]
+        ]
+
+        compare = LoadSetCompare(
+            loadset1_metadata={"name": "LoadSet 1"},
+            loadset2_metadata={"name": "LoadSet 2"},
+            comparison_rows=rows,
+        )
+
+        arrays = compare.to_arrays()
+
+        assert set(arrays) == {
+            "point_name",
+            "component",
+            "type",
+            "loadset1_value",
+            "loadset2_value",
+            "pct_diff",
+        }
+        assert arrays["point_name"].tolist() == ["Point_A", "Point_A"]
+        assert arrays["type"].tolist() == ["max", "min"]
+        assert arrays["loadset1_value"].tolist() == [100.0, 80.0]
+        assert arrays["loadset2_value"].tolist() == [120.0, 90.0]
+        assert arrays["pct_diff"].tolist() == pytest.approx([20.0, 12.5])
+
     def test_export_comparison_report(self):
         """Test export_comparison_report method generates complete reports."""
         import tempfile
@@ -160,6 +160,26 @@ class TestRangeChartGeneration:
             assert output_dir.is_dir()
             assert len(generated_files) > 0
 
+    @pytest.mark.slow
+    def test_generate_range_charts_parallel(self):
+        """Test that process-pool rendering produces the same charts as sequential."""
+        comparison = self.loadset1.compare_to(self.loadset2)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sequential_files = comparison.generate_range_charts(
+                Path(temp_dir) / "sequential"
+            )
+            parallel_files = comparison.generate_range_charts(
+                Path(temp_dir) / "parallel", max_workers=2
+            )
+
+            assert parallel_files.keys() == sequential_files.keys()
+            for point_name, file_path in parallel_files.items():
+                path_obj = Path(file_path)
+                assert path_obj.exists()
+                assert path_obj.name == Path(sequential_files[point_name]).name
+                assert path_obj.stat().st_size > 0
+
     def test_extract_component_ranges(self):
         """Test the _extract_component_ranges helper method."""
         comparison = self.loadset1.compare_to(self.loadset2)
@@ -1,10 +1,16 @@
 from typing import Literal
+from collections import defaultdict
 from pathlib import Path
 from os import PathLike
 import json
 import re
 from pydantic import BaseModel, ValidationError
 
+try:
+    import orjson  # Optional: faster parsing of float-heavy loads JSON
+except ImportError:
+    orjson = None
+
 # Type aliases for units
 ForceUnit = Literal["N", "kN", "lbf", "klbf"]
 MomentUnit = Literal["Nm", "kNm", "lbf-ft"]
@@ -66,6 +72,33 @@ class LoadSetCompare(BaseModel):
         """
         return json.dumps(self.to_dict(), indent=indent)
 
+    def to_arrays(self) -> dict:
+        """
+        Export comparison rows as NumPy arrays, one array per field.
+
+        Rows keep the order of comparison_rows, so each max row produced by
+        LoadSet.compare_to is directly followed by its matching min row.
+
+        Returns:
+            dict: Mapping of "point_name", "component", "type", "loadset1_value",
+                  "loadset2_value" and "pct_diff" to NumPy arrays
+        """
+        import numpy as np
+
+        rows = self.comparison_rows
+        return {
+            "point_name": np.array([row.point_name for row in rows], dtype=str),
+            "component": np.array([row.component for row in rows], dtype=str),
+            "type": np.array([row.type for row in rows], dtype=str),
+            "loadset1_value": np.array(
+                [row.loadset1_value for row in rows], dtype=np.float64
+            ),
+            "loadset2_value": np.array(
+                [row.loadset2_value for row in rows], dtype=np.float64
+            ),
+            "pct_diff": np.array([row.pct_diff for row in rows], dtype=np.float64),
+        }
+
     def new_exceeds_old(self) -> bool:
         """
         Check if loadset2 (new) exceeds loadset1 (old) envelope in every component comparison.
@@ -181,6 +214,8 @@ class LoadSetCompare(BaseModel):
         output_dir: PathLike | None = None,
         image_format: str = "png",
         as_base64: bool = False,
+        max_workers: int | None = None,
+        png_compress_level: int | None = None,
     ) -> dict[str, Path | str]:
         """
         Generate range bar chart images comparing LoadSets for each point.
@@ -192,6 +227,10 @@ class LoadSetCompare(BaseModel):
             output_dir: Directory to save the generated images (required if as_base64=False)
             image_format: Image format (png, svg)
             as_base64: If True, return base64-encoded strings instead of saving files
+            max_workers: If greater than 1, render points in parallel using a
+                         process pool of this size (default: sequential)
+            png_compress_level: Optional zlib level (0-9) for saved PNG files;
+                                lower is faster but larger (default: Pillow's)
 
         Returns:
             dict: If as_base64=False, mapping of point names to generated image file paths.
@@ -204,9 +243,6 @@ class LoadSetCompare(BaseModel):
         """
         try:
             import matplotlib
-            matplotlib.use('Agg')  # Use non-interactive backend to avoid GUI threading issues
-            import matplotlib.pyplot as plt
-            import matplotlib.patches as mpatches
         except ImportError:
             raise ImportError("matplotlib is required for image generation")
 
@@ -234,119 +270,228 @@ class LoadSetCompare(BaseModel):
                     f"Output path exists but is not a directory: {output_dir}"
                 )
 
-        # Group comparison rows by point
-        points_data = {}
-        for row in self.comparison_rows:
-            if row.point_name not in points_data:
-                points_data[row.point_name] = []
-            points_data[row.point_name].append(row)
+        point_ranges = self.get_point_ranges()
+
+        if max_workers is not None and max_workers > 1 and len(point_ranges) > 1:
+            # Points are independent, so render them in separate processes.
+            # Use "spawn" so workers don't inherit pytest/matplotlib state.
+            import multiprocessing as mp
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(
+                max_workers=min(max_workers, len(point_ranges)),
+                mp_context=mp.get_context("spawn"),
+            ) as executor:
+                futures = {
+                    point_name: executor.submit(
+                        self.generate_range_chart_for_point,
+                        point_name,
+                        ranges,
+                        output_path,
+                        image_format,
+                        as_base64,
+                        png_compress_level=png_compress_level,
+                    )
+                    for point_name, ranges in point_ranges.items()
+                }
+                return {
+                    point_name: future.result()
+                    for point_name, future in futures.items()
+                }
 
-        generated_files = {}
+        import matplotlib
+        matplotlib.use('Agg')  # Use non-interactive backend to avoid GUI threading issues
+        import matplotlib.pyplot as plt
 
-        for point_name, rows in points_data.items():
-            # Create figure with dual subplots - narrower width
-            fig, (ax_forces, ax_moments) = plt.subplots(1, 2, figsize=(8, 6))
-            fig.suptitle(
-                f"{point_name}: Forces vs Moments Comparison",
-                fontsize=14,
-                fontweight="bold",
-            )
-
-            # Process data for forces and moments
-            force_data = self._extract_component_ranges(rows, ["fx", "fy", "fz"])
-            moment_data = self._extract_component_ranges(rows, ["mx", "my", "mz"])
-
-            # Create force subplot
-            if force_data:
-                self._create_range_subplot(
-                    ax_forces,
-                    force_data,
-                    "Forces",
-                    self.loadset1_metadata.get("units", {}).get("forces", "N"),
-                )
-            else:
-                ax_forces.text(
-                    0.5,
-                    0.5,
-                    "No force data",
-                    ha="center",
-                    va="center",
-                    transform=ax_forces.transAxes,
-                )
-                ax_forces.set_title("Forces")
-
-            # Create moment subplot
-            if moment_data:
-                self._create_range_subplot(
-                    ax_moments,
-                    moment_data,
-                    "Moments",
-                    self.loadset1_metadata.get("units", {}).get("moments", "Nm"),
-                )
-            else:
-                ax_moments.text(
-                    0.5,
-                    0.5,
-                    "No moment data",
-                    ha="center",
-                    va="center",
-                    transform=ax_moments.transAxes,
+        # Reuse one figure for every point, cleared between charts
+        fig = plt.figure(figsize=(8, 6))
+        try:
+            return {
+                point_name: self.generate_range_chart_for_point(
+                    point_name,
+                    ranges,
+                    output_path,
+                    image_format,
+                    as_base64,
+                    fig=fig,
+                    png_compress_level=png_compress_level,
                 )
-                ax_moments.set_title("Moments")
+                for point_name, ranges in point_ranges.items()
+            }
+        finally:
+            plt.close(fig)
 
-            # Add legend
-            loadset1_name = self.loadset1_metadata.get("name", "LoadSet 1")
-            loadset2_name = self.loadset2_metadata.get("name", "LoadSet 2")
+    def generate_range_chart_for_point(
+        self,
+        point_name: str,
+        ranges: dict[str, dict],
+        output_dir: PathLike | None = None,
+        image_format: str = "png",
+        as_base64: bool = False,
+        fig=None,
+        png_compress_level: int | None = None,
+    ) -> Path | str:
+        """
+        Generate the range bar chart image for a single point.
 
-            loadset1_patch = mpatches.Patch(
-                color="lightgrey", alpha=1.0, label=loadset1_name
+        Args:
+            point_name: Name of the point
+            ranges: Force and moment range data for the point, as returned
+                    by get_point_ranges()[point_name]
+            output_dir: Existing directory to save the image (required if as_base64=False)
+            image_format: Image format (png, svg)
+            as_base64: If True, return a base64-encoded string instead of saving a file
+            fig: Optional matplotlib Figure to draw into; it is cleared first and
+                 left open for reuse. If None, a new figure is created and closed.
+            png_compress_level: Optional zlib level (0-9) for saved PNG files;
+                                lower is faster but larger (default: Pillow's)
+
+        Returns:
+            Path | str: Generated image file path, or base64-encoded image string
+        """
+        import matplotlib
+        matplotlib.use('Agg')  # Use non-interactive backend to avoid GUI threading issues
+        import matplotlib.pyplot as plt
+        import matplotlib.patches as mpatches
+
+        output_path = Path(output_dir) if output_dir is not None else None
+
+        # Create (or clear) figure with dual subplots - narrower width
+        owns_figure = fig is None
+        if owns_figure:
+            fig = plt.figure(figsize=(8, 6))
+        else:
+            fig.clf()
+        ax_forces, ax_moments = fig.subplots(1, 2)
+        fig.suptitle(
+            f"{point_name}: Forces vs Moments Comparison",
+            fontsize=14,
+            fontweight="bold",
+        )
+
+        # Force and moment range data for this point
+        force_data = ranges["forces"]
+        moment_data = ranges["moments"]
+
+        # Create force subplot
+        if force_data:
+            self._create_range_subplot(
+                ax_forces,
+                force_data,
+                "Forces",
+                self.loadset1_metadata.get("units", {}).get("forces", "N"),
             )
-            loadset2_normal_patch = mpatches.Patch(
-                color="darkgrey", alpha=1.0, label=f"{loadset2_name} (within range)"
+        else:
+            ax_forces.text(
+                0.5,
+                0.5,
+                "No force data",
+                ha="center",
+                va="center",
+                transform=ax_forces.transAxes,
             )
-            loadset2_exceed_patch = mpatches.Patch(
-                color="maroon", alpha=1.0, label=f"{loadset2_name} (exceeds range)"
+            ax_forces.set_title("Forces")
+
+        # Create moment subplot
+        if moment_data:
+            self._create_range_subplot(
+                ax_moments,
+                moment_data,
+                "Moments",
+                self.loadset1_metadata.get("units", {}).get("moments", "Nm"),
             )
-            fig.legend(
-                handles=[loadset1_patch, loadset2_normal_patch, loadset2_exceed_patch],
-                loc="upper center",
-                bbox_to_anchor=(0.5, 0.02),
-                ncol=3,
+        else:
+            ax_moments.text(
+                0.5,
+                0.5,
+                "No moment data",
+                ha="center",
+                va="center",
+                transform=ax_moments.transAxes,
             )
+            ax_moments.set_title("Moments")
 
-            # Adjust layout and save
-            plt.tight_layout()
-            plt.subplots_adjust(top=0.85, bottom=0.15)
+        # Add legend
+        loadset1_name = self.loadset1_metadata.get("name", "LoadSet 1")
+        loadset2_name = self.loadset2_metadata.get("name", "LoadSet 2")
 
-            if as_base64:
-                # Generate base64 string
-                import io
-                import base64
+        loadset1_patch = mpatches.Patch(
+            color="lightgrey", alpha=1.0, label=loadset1_name
+        )
+        loadset2_normal_patch = mpatches.Patch(
+            color="darkgrey", alpha=1.0, label=f"{loadset2_name} (within range)"
+        )
+        loadset2_exceed_patch = mpatches.Patch(
+            color="maroon", alpha=1.0, label=f"{loadset2_name} (exceeds range)"
+        )
+        fig.legend(
+            handles=[loadset1_patch, loadset2_normal_patch, loadset2_exceed_patch],
+            loc="upper center",
+            bbox_to_anchor=(0.5, 0.02),
+            ncol=3,
+        )
 
-                buffer = io.BytesIO()
-                plt.savefig(buffer, format=image_format, dpi=300, bbox_inches="tight")
-                buffer.seek(0)
+        # Adjust layout and save
+        fig.tight_layout()
+        fig.subplots_adjust(top=0.85, bottom=0.15)
 
-                # Convert to base64
-                image_base64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
-                generated_files[point_name] = image_base64
+        if as_base64:
+            # Generate base64 string
+            import io
+            import base64
 
-                buffer.close()
-            else:
-                # Save to file
-                assert (
-                    output_path is not None
-                )  # This should never be None when as_base64=False
-                safe_point_name = self._sanitize_filename(point_name)
-                filename = f"{safe_point_name}_ranges.{image_format}"
-                file_path = output_path / filename
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format=image_format, dpi=300, bbox_inches="tight")
+            buffer.seek(0)
 
-                plt.savefig(file_path, dpi=300, bbox_inches="tight")
-                generated_files[point_name] = file_path
+            # Convert to base64
+            chart = base64.b64encode(buffer.getvalue()).decode("utf-8")
 
-            plt.close()
+            buffer.close()
+        else:
+            # Save to file
+            assert (
+                output_path is not None
+            )  # This should never be None when as_base64=False
+            safe_point_name = self._sanitize_filename(point_name)
+            filename = f"{safe_point_name}_ranges.{image_format}"
+            file_path = output_path / filename
+
+            # Matplotlib encodes PNGs through Pillow; let callers trade size for speed
+            save_kwargs = {}
+            if image_format == "png" and png_compress_level is not None:
+                save_kwargs["pil_kwargs"] = {"compress_level": png_compress_level}
+            fig.savefig(file_path, dpi=300, bbox_inches="tight", **save_kwargs)
+            chart = file_path
+
+        if owns_figure:
+            plt.close(fig)
+
+        return chart
+
+    def get_point_ranges(self) -> dict[str, dict[str, dict]]:
+        """
+        Group comparison rows by point and extract force and moment ranges.
 
-        return generated_files
+        This is the per-point data generate_range_charts passes to
+        generate_range_chart_for_point for each point.
+
+        Returns:
+            dict: Mapping of point names to {"forces": ..., "moments": ...},
+                  each holding component range data as returned by
+                  _extract_component_ranges
+        """
+        points_data: defaultdict[str, list[ComparisonRow]] = defaultdict(list)
+        for row in self.comparison_rows:
+            points_data[row.point_name].append(row)
+
+        return {
+            point_name: {
+                "forces": self._extract_component_ranges(rows, ["fx", "fy", "fz"]),
+                "moments": self._extract_component_ranges(rows, ["mx", "my", "mz"]),
+            }
+            for point_name, rows in points_data.items()
+        }
 
     def _extract_component_ranges(
         self, rows: list[ComparisonRow], components: list[str]
@@ -361,26 +506,16 @@ class LoadSetCompare(BaseModel):
         Returns:
             dict: Component data with min/max values for both LoadSets
         """
+        # Index rows by (component, type) in one pass; first match wins
+        rows_by_key: dict[tuple[str, str], ComparisonRow] = {}
+        for row in rows:
+            rows_by_key.setdefault((row.component, row.type), row)
+
         component_data = {}
 
         for component in components:
-            # Find max and min rows for this component
-            max_row = next(
-                (
-                    row
-                    for row in rows
-                    if row.component == component and row.type == "max"
-                ),
-                None,
-            )
-            min_row = next(
-                (
-                    row
-                    for row in rows
-                    if row.component == component and row.type == "min"
-                ),
-                None,
-            )
+            max_row = rows_by_key.get((component, "max"))
+            min_row = rows_by_key.get((component, "min"))
 
             if max_row and min_row:
                 component_data[component] = {
@@ -703,8 +838,9 @@ class LoadSet(BaseModel):
         path = Path(file_path)
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            # Read the whole file in one call and parse from bytes
+            raw = path.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file_path}")
         except json.JSONDecodeError as e:
@@ -9,7 +9,6 @@ from typing import Optional
 from os import PathLike
 import sys
 from pathlib import Path
-import json
 
 # Add the tools directory to Python path so we can import loads
 tools_dir = Path(__file__).parent.parent  # Go up one level from mcps to tools
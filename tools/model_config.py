@@ -6,6 +6,7 @@ across all agents, following pydantic-ai best practices.
 """
 
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -55,10 +56,14 @@ def get_model_id() -> str:
     return MODEL_NAME
 
 
+@lru_cache(maxsize=1)
 def validate_model_config() -> tuple[bool, str | None]:
     """
     Validate that the model is properly configured.
 
+    The result is cached for the life of the process; call
+    validate_model_config.cache_clear() after changing API key variables.
+
     Returns:
         tuple: (is_valid, error_message)
     """